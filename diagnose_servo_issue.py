@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 """
 Diagnostic script to troubleshoot servo control issues
+
+Shows the packet dumps of each debug send; pass --quiet to hide them.
 """
 
 from robot_servo_control import RobotServoController
+import logging
 import time
 import sys
 
 ROBOT_IP = "192.168.0.132"
 ROBOT_PORT = 7777
+QUIET = "--quiet" in sys.argv
 
 def main():
     print("=" * 60)
@@ -32,7 +36,7 @@ def main():
     print("✓ Connection successful\n")
     
     # Step 2: Test with debug output
-    print("Step 2: Testing servo command with debug output...")
+    print("Step 2: Testing servo command with debug output (run with --quiet to hide packet dumps)...")
     print("-" * 60)
     
     # Try moving just one motor first
@@ -126,6 +130,7 @@ def main():
     return True
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING if QUIET else logging.DEBUG, format="%(message)s")
     try:
         main()
     except KeyboardInterrupt:
@@ -1,14 +1,32 @@
 #!/usr/bin/env python3
 """
 Diagnostic script to troubleshoot servo control issues via USB/Serial
+
+Options: --quiet hides the packet dumps, --fast skips the pauses between steps.
 """
 
 from robot_servo_control_usb import RobotServoControllerUSB
+import logging
 import time
 import sys
 
 SERIAL_PORT = "COM20"  # Change this to your serial port
 SERIAL_BAUD = 57600    # Serial communication baud rate
+FAST_PAUSE = 0.1       # Gap between steps with --fast (seconds)
+
+# Pass --fast to skip the pauses for watching the motors move. Every command here is a
+# broadcast SYNC WRITE, which servos never answer, so there is no reply to wait for instead;
+# with --fast only the sending side is exercised and the motion can't be judged.
+FAST = "--fast" in sys.argv
+QUIET = "--quiet" in sys.argv
+
+def pause_for_motors(seconds):
+    """Pause between diagnostic steps so the motors can finish moving and be watched"""
+    if FAST:
+        time.sleep(FAST_PAUSE)
+        return
+    print(f"Waiting {seconds} seconds to see if motors move...")
+    time.sleep(seconds)
 
 def main():
     print("=" * 60)
@@ -34,7 +52,7 @@ def main():
     print("✓ Connection successful\n")
     
     # Step 2: Test with debug output
-    print("Step 2: Testing servo command with debug output...")
+    print("Step 2: Testing servo command with debug output (run with --quiet to hide packet dumps)...")
     print("-" * 60)
     
     # Try moving just one motor first
@@ -48,8 +66,7 @@ def main():
     
     if success:
         print("\n✓ Command sent successfully")
-        print("Waiting 2 seconds to see if motor moves...")
-        time.sleep(2)
+        pause_for_motors(2)
     else:
         print("\n✗ Failed to send command")
         return False
@@ -61,15 +78,14 @@ def main():
     
     success = robot.send_servo_positions_debug(
         motor_ids=list(range(1, 13)),
-        motor_types=[robot.MOTORTYPE_AX12] * 12,
+        motor_types=robot.AX12_TYPES_12,
         positions_degrees=[150, 90, 150, 150, 210, 150, 150, 90, 150, 150, 210, 150],
         velocities_rpm=[30.0] * 12
     )
     
     if success:
         print("\n✓ Neutral command sent")
-        print("Waiting 3 seconds...")
-        time.sleep(3)
+        pause_for_motors(3)
     else:
         print("\n✗ Failed to send neutral command")
     
@@ -91,7 +107,7 @@ def main():
             velocities_rpm=[30.0]
         )
         if success:
-            time.sleep(2)
+            pause_for_motors(2)
     
     # Step 5: Check motor IDs
     print("\n" + "-" * 60)
@@ -106,16 +122,18 @@ def main():
         positions_degrees=[180, 120, 180],
         velocities_rpm=[30.0, 30.0, 30.0]
     )
-    time.sleep(2)
+    pause_for_motors(2)
     
     # Return to neutral
     print("\nReturning to neutral...")
     robot.move_to_neutral()
-    time.sleep(1)
+    pause_for_motors(1)
     
     print("\n" + "=" * 60)
     print("DIAGNOSTIC COMPLETE")
     print("=" * 60)
+    if FAST:
+        print("\nRan with --fast: run without it to watch the motors move between steps")
     print("\nIf motors still don't move, check:")
     print("  1. Servos are powered (LEDs should be on)")
     print("  2. Motor IDs are correct (1-12)")
@@ -128,6 +146,7 @@ def main():
     return True
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING if QUIET else logging.DEBUG, format="%(message)s")
     try:
         main()
     except KeyboardInterrupt:
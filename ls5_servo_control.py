@@ -9,15 +9,18 @@ ls5_servo_set_baud_and_angle.py
 Wraps Dynamixel Protocol 1.0 packets in the LUCI general packet header used in your Java code,
 then sends them over TCP to the LS5 (port 7777).
 """
+import select
 import socket
+import struct
 import time
-from typing import List
+from typing import List, Tuple
 
 LS5_IP = "192.168.0.110"   # <--- change to your LS5 IP
 LS5_PORT = 7777
 
-def get_lh_bytes(x: int) -> bytes:
-    return bytes([x & 0xFF, (x >> 8) & 0xFF])
+_pack_lh = struct.Struct('<H').pack  # little-endian uint16
+# LUCI general header: 0,0,2, mbnum (LE u16), 0,0,0, payload length (LE u16)
+_pack_luci_header = struct.Struct('<2xBH3xH').pack
 
 def build_write_packet(servo_id: int, address: int, data: bytes) -> bytes:
     """
@@ -29,39 +32,155 @@ def build_write_packet(servo_id: int, address: int, data: bytes) -> bytes:
     CHECKSUM = 255 - ((ID + LENGTH + INSTRUCTION + sum(params)) & 0xFF)
     """
     INSTR_WRITE = 0x03
-    params = bytes([address]) + data
+    params = bytes((address, *data))
     length = len(params) + 2  # instruction + params + checksum => length field as Dynamixel doc
-    header = bytearray([0xFF, 0xFF, servo_id & 0xFF, length & 0xFF, INSTR_WRITE])
-    body = bytearray(params)
-    checksum_val = (servo_id + length + INSTR_WRITE + sum(body)) & 0xFF
-    checksum = (255 - checksum_val) & 0xFF
-    packet = bytes(header + body + bytearray([checksum]))
-    return packet
+    checksum = ~(servo_id + length + INSTR_WRITE + sum(params)) & 0xFF
+    return bytes((0xFF, 0xFF, servo_id & 0xFF, length & 0xFF, INSTR_WRITE, *params, checksum))
+
+def build_sync_write_packet(address: int, motor_writes: List[Tuple[int, bytes]]) -> bytes:
+    """
+    Build a Dynamixel Protocol 1.0 SYNC WRITE packet so one bus frame updates several servos.
+    Packet format:
+      0xFF 0xFF 0xFE LENGTH 0x83 ADDRESS DATA_LEN [ID DATA...]... CHECKSUM
+    where LENGTH = (DATA_LEN + 1) * N + 4. Every servo must write the same number of bytes.
+    """
+    INSTR_SYNC_WRITE = 0x83
+    data_len = len(motor_writes[0][1]) if motor_writes else 0
+    packet = bytearray((0xFF, 0xFF, 0xFE, 0, INSTR_SYNC_WRITE, address, data_len))
+    for servo_id, data in motor_writes:
+        if len(data) != data_len:
+            raise ValueError("SYNC WRITE requires equal data length for every servo")
+        packet.append(servo_id & 0xFF)
+        packet.extend(data)
+    packet[3] = (len(packet) - 3) & 0xFF  # params + instruction + checksum
+    # Checksum covers ID..last param; sum() over a memoryview slice runs in C without copying
+    packet.append(~sum(memoryview(packet)[2:]) & 0xFF)
+    return bytes(packet)
+
+def build_write_batch(address: int, motor_writes: List[Tuple[int, bytes]]) -> bytes:
+    """
+    Fallback for bridges without SYNC WRITE support: concatenate one WRITE packet per servo
+    so they still travel in a single LUCI payload / TCP send.
+    """
+    return b''.join(build_write_packet(servo_id, address, data) for servo_id, data in motor_writes)
 
 def create_luci_general_packet(mbnum: int, payload: bytes) -> bytes:
     """
     LUCI header used in your Java code:
       [0,0,2, mbnum_low, mbnum_high, 0,0,0, luci_len_low, luci_len_high] + payload
     """
-    mb_bytes = get_lh_bytes(mbnum)
-    luci_len_bytes = get_lh_bytes(len(payload))
-    header = bytearray([
-        0, 0, 2,
-        mb_bytes[0], mb_bytes[1],
-        0, 0, 0,
-        luci_len_bytes[0], luci_len_bytes[1]
-    ])
-    return bytes(header) + payload
+    return _pack_luci_header(2, mbnum & 0xFFFF, len(payload) & 0xFFFF) + payload
 
-def send_luci_packet(ip: str, port: int, luci_packet: bytes, timeout=1.0) -> bytes:
-    with socket.create_connection((ip, port), timeout=5) as sock:
-        sock.settimeout(timeout)
-        sock.sendall(luci_packet)
+class LS5Client:
+    """
+    Persistent TCP connection to the LS5 bridge.
+    Keeps one socket open across commands (instead of a connect/teardown per packet)
+    and disables Nagle so small LUCI packets go out immediately.
+    """
+    def __init__(self, ip: str, port: int, timeout: float = 1.0):
+        # Resolve once; reconnects reuse the sockaddr without another getaddrinfo
+        self.address = socket.getaddrinfo(ip, port, socket.AF_INET, socket.SOCK_STREAM)[0][4]
+        self.timeout = timeout
+        self.connect()
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.settimeout(5)
         try:
-            resp = sock.recv(2048)
-            return resp
+            self.sock.connect(self.address)
+        except OSError:
+            self.sock.close()
+            raise
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Room for a whole batched payload so each sendall is a single kernel copy
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+        # Detect a dead bridge within ~5s instead of stalling on a half-open connection
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        for option, value in (("TCP_KEEPIDLE", 2), ("TCP_KEEPINTVL", 1), ("TCP_KEEPCNT", 3)):
+            if hasattr(socket, option):
+                self.sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+        self.sock.settimeout(self.timeout)
+        self._quickack()
+
+    def _quickack(self):
+        # Linux only: ACK replies immediately instead of delaying up to 40ms.
+        # The kernel clears this flag again, so it is re-armed after every receive.
+        if hasattr(socket, "TCP_QUICKACK"):
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+
+    def send(self, luci_packet: bytes, timeout: float = None) -> bytes:
+        if timeout is not None:
+            self.timeout = timeout
+            self.sock.settimeout(timeout)
+        self.send_nowait(luci_packet)
+        try:
+            resp = self.sock.recv(2048)
         except socket.timeout:
             return b''
+        self._quickack()
+        return resp
+
+    def send_nowait(self, luci_packet: bytes):
+        """Send without waiting for a reply; pair with poll() to collect responses."""
+        try:
+            self.sock.sendall(luci_packet)
+        except (BrokenPipeError, ConnectionResetError):
+            # Bridge dropped the session: reconnect once and retry
+            self.close()
+            self.connect()
+            self.sock.sendall(luci_packet)
+
+    def poll(self, timeout: float = 0.0) -> bytes:
+        """Return whatever the bridge has sent, waiting at most timeout seconds (b'' if nothing)."""
+        ready, _, _ = select.select([self.sock], [], [], timeout)
+        if not ready:
+            return b''
+        resp = self.sock.recv(2048)
+        if not resp:
+            raise ConnectionResetError("LS5 closed the connection")
+        self._quickack()
+        return resp
+
+    def close(self):
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def send_at_rate(client: LS5Client, luci_packets: List[bytes], rate_hz: float = 5.0) -> List[bytes]:
+    """
+    Send packets over an open client on a fixed cadence (5 Hz by default).
+    Ticks are scheduled from a perf_counter deadline so they don't drift, and replies are
+    gathered with poll() while waiting for the next tick. Nothing follows the last packet, so
+    its reply is awaited up to the client timeout. Returns the bytes received per packet.
+    """
+    period = 1.0 / rate_hz
+    responses = []
+    next_tick = time.perf_counter()
+    last = len(luci_packets) - 1
+    for index, luci_packet in enumerate(luci_packets):
+        client.send_nowait(luci_packet)
+        next_tick += period
+        deadline = next_tick
+        if index == last:
+            deadline = max(next_tick, time.perf_counter() + client.timeout)
+        resp = b''
+        while True:
+            now = time.perf_counter()
+            # Past the tick only a still-missing reply is waited for
+            if now >= deadline or (resp and now >= next_tick):
+                break
+            resp += client.poll(deadline - now)
+        responses.append(resp)
+    return responses
+
+def send_luci_packet(ip: str, port: int, luci_packet: bytes, timeout=1.0) -> bytes:
+    """One-shot send; prefer LS5Client when sending more than one packet."""
+    with LS5Client(ip, port, timeout=timeout) as client:
+        return client.send(luci_packet)
 
 def angle_deg_to_ax_position(angle_deg: float) -> int:
     """
@@ -72,40 +191,45 @@ def angle_deg_to_ax_position(angle_deg: float) -> int:
     pos = round((angle_deg / 300.0) * 1023.0)
     return max(0, min(1023, pos))
 
+def angles_deg_to_ax_positions(angles_deg: List[float]) -> List[int]:
+    """
+    Batch form of angle_deg_to_ax_position for a whole pose (e.g. 12 servos)
+    in one comprehension instead of one function call per servo.
+    """
+    return [max(0, min(1023, round((a / 300.0) * 1023.0))) for a in angles_deg]
+
+# Baud register value is computed and range-checked once at import.
+TARGET_BPS = 222222
+BAUD_VALUE = round((2000000.0 / TARGET_BPS) - 1.0)  # -> 8 for 222222
+if BAUD_VALUE < 0 or BAUD_VALUE > 254:
+    raise ValueError("Computed baud register out of range: %d" % BAUD_VALUE)
+BAUD_VALUE_BYTES = bytes([BAUD_VALUE])
+
 if __name__ == "__main__":
     servo_id = 1
-    # 1) Set baudrate to ~222,222 bps: compute register value
-    target_bps = 222222
-    baud_value = round((2000000.0 / target_bps) - 1.0)  # -> 8 for 222222
-    if baud_value < 0 or baud_value > 254:
-        raise ValueError("Computed baud register out of range: %d" % baud_value)
-    print(f"Setting servo ID {servo_id} baud register (addr=4) -> value {baud_value} (target ~{target_bps} bps)")
-
-    # Build WRITE packet to address 4 with a single byte (baud_value)
-    write_baud_pkt = build_write_packet(servo_id=servo_id, address=4, data=bytes([baud_value]))
+    # 1) Set baudrate to ~222,222 bps (register value precomputed in BAUD_VALUE)
+    print(f"Setting servo ID {servo_id} baud register (addr=4) -> value {BAUD_VALUE} (target ~{TARGET_BPS} bps)")
+
+    # Build WRITE packet to address 4 with a single byte (BAUD_VALUE)
+    write_baud_pkt = build_write_packet(servo_id=servo_id, address=4, data=BAUD_VALUE_BYTES)
     luci_pkt_baud = create_luci_general_packet(mbnum=254, payload=write_baud_pkt)
     print("LUCI packet (set baud) hex:", luci_pkt_baud.hex())
 
-    resp = send_luci_packet(LS5_IP, LS5_PORT, luci_pkt_baud, timeout=0.8)
-    print("Response (set baud) (hex):", resp.hex() if resp else "<no response>")
-
-    # IMPORTANT: after changing servo baudrate, the servo will expect frames at new baud.
-    # If the LS5/bridge does not switch its UART speed automatically, further commands may not reach the servo.
-    # Wait a short moment (and ensure your LS5 supports switching its UART speed to match).
-    time.sleep(0.2)
-
     # 2) Set angle (goal position) at address 30 (two bytes little-endian)
     desired_angle = 90.0   # degrees; change this to whatever angle you want (0..300)
     pos = angle_deg_to_ax_position(desired_angle)
-    pos_lo = pos & 0xFF
-    pos_hi = (pos >> 8) & 0xFF
     print(f"Setting servo ID {servo_id} goal position -> angle {desired_angle} deg -> position {pos}")
 
-    write_goal_pkt = build_write_packet(servo_id=servo_id, address=30, data=bytes([pos_lo, pos_hi]))
+    write_goal_pkt = build_write_packet(servo_id=servo_id, address=30, data=_pack_lh(pos))
     luci_pkt_goal = create_luci_general_packet(mbnum=254, payload=write_goal_pkt)
     print("LUCI packet (set goal) hex:", luci_pkt_goal.hex())
 
-    resp2 = send_luci_packet(LS5_IP, LS5_PORT, luci_pkt_goal, timeout=0.8)
+    # IMPORTANT: after changing servo baudrate, the servo will expect frames at new baud.
+    # If the LS5/bridge does not switch its UART speed automatically, further commands may not reach the servo.
+    # Sending at 5 Hz leaves a 200ms gap after the baud change (and ensure your LS5 supports switching its UART speed to match).
+    with LS5Client(LS5_IP, LS5_PORT, timeout=0.8) as client:
+        resp, resp2 = send_at_rate(client, [luci_pkt_baud, luci_pkt_goal], rate_hz=5.0)
+    print("Response (set baud) (hex):", resp.hex() if resp else "<no response>")
     print("Response (set goal) (hex):", resp2.hex() if resp2 else "<no response>")
 
     print("Done.")
@@ -1,11 +1,65 @@
+import bisect
+import collections
+import functools
+import itertools
+import os
+import queue
+import re
+import selectors
 import serial
 import time
 import threading
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
-from datetime import datetime
+from tkinter import ttk, messagebox
+
+@functools.lru_cache(maxsize=32)
+def compile_search(search_term, case_sensitive):
+    """Compiled literal pattern for a search term, cached across keystrokes"""
+    return re.compile(re.escape(search_term), 0 if case_sensitive else re.IGNORECASE)
+
+def line_offsets(text):
+    """Character offset at which each line of text starts, for offset -> "line.column" conversion"""
+    offsets = [0]
+    offsets.extend(itertools.accumulate(len(line) + 1 for line in text.split("\n")))
+    return offsets
+
+def match_indices(matches):
+    """Flatten (line, start, end) matches into the start/end Tk index pairs tag_add takes"""
+    for line, start, end in matches:
+        yield f"{line}.{start}"
+        yield f"{line}.{end}"
+
+def self_overlapping(term):
+    """True if occurrences of term can overlap (a proper prefix is also a suffix, e.g. "aa", "abab")"""
+    return any(term.endswith(term[:size]) for size in range(1, len(term)))
+
 
 class LS6LogsReaderGUI:
+    # Oldest log lines are trimmed beyond this to keep memory and redraw cost bounded
+    MAX_LOG_LINES = 20000
+    
+    # Keys that move around the logs; every other key is swallowed (besides copy)
+    LOGS_NAVIGATION_KEYS = {"Left", "Right", "Up", "Down", "Prior", "Next", "Home", "End"}
+    LOGS_COPY_KEYS = {"c", "C", "Insert", "slash"}
+    
+    # Ctrl+C (ASCII 0x03, interrupt character), shared by every interrupt sent
+    CTRL_C = b"\x03"
+    
+    # Typing in the search box re-runs the search after this much idle time
+    SEARCH_DELAY_MS = 150
+    
+    # Text without a trailing newline (e.g. a shell prompt) is shown after this much idle time
+    READ_IDLE_TIMEOUT = 0.1
+    
+    # Log text tags and their colors, configured once when the widget is created
+    LOG_TAGS = {
+        "info": "#d4d4d4",
+        "ok": "#27ae60",
+        "err": "#e74c3c",
+        "sent": "#3498db",
+        "interrupt": "#ff8800",
+    }
+    
     def __init__(self, root):
         self.root = root
         self.root.title("LS6 Logs Reader")
@@ -18,14 +72,44 @@ class LS6LogsReaderGUI:
         self.read_thread = None
         self.stop_reading = False
         
+        # Self-pipe that wakes the reader thread out of select() on disconnect (POSIX only)
+        self.wake_pipe = None
+        if os.name == "posix":
+            self.wake_pipe = os.pipe()
+            os.set_blocking(self.wake_pipe[0], False)
+        
+        # Outgoing data is written by a background thread so a slow port never blocks Tk
+        self.tx_queue = queue.Queue()
+        self.write_thread = threading.Thread(target=self.write_serial, daemon=True)
+        self.write_thread.start()
+        
         # Default settings
         self.port_var = tk.StringVar(value="COM21")
         self.baud_var = tk.StringVar(value="57600")
         
-        # Search variables
+        # Search variables; matches are sorted (line, start column, end column) tuples
         self.search_matches = []
         self.current_match_index = -1
         self.case_sensitive = False
+        # Term the current matches belong to; new log lines are scanned for it as they arrive
+        self.search_term = ""
+        # Whether any search tag may be applied, so clearing can skip the tag_remove calls
+        self.has_search_tags = False
+        # Set while a retag_viewport call is queued (after_idle)
+        self.retag_scheduled = False
+        # Pending debounced search started from typing (root.after id)
+        self.search_after_id = None
+        
+        # Log lines are queued here (from any thread) and inserted in batches by flush_logs,
+        # which is scheduled on demand by the first message of each batch
+        self.pending_logs = collections.deque()
+        self.log_lock = threading.Lock()
+        self.flush_scheduled = False
+        self.timestamp_cache = (None, "")
+        
+        # Cached copies of the widget text for search (None = stale)
+        self.buffer_text = None
+        self.buffer_lower = None
         
         self.create_widgets()
         
@@ -121,7 +205,7 @@ class LS6LogsReaderGUI:
         )
         self.search_entry.pack(side=tk.LEFT, padx=2)
         self.search_entry.bind("<Return>", lambda e: self.search_text())
-        self.search_entry.bind("<KeyRelease>", lambda e: self.search_text())
+        self.search_entry.bind("<KeyRelease>", lambda e: self.schedule_search())
         
         # Case sensitive checkbox
         self.case_var = tk.BooleanVar()
@@ -182,18 +266,42 @@ class LS6LogsReaderGUI:
         )
         clear_search_button.pack(side=tk.LEFT, padx=2)
         
-        self.logs_text = scrolledtext.ScrolledText(
-            logs_frame,
-            wrap=tk.WORD,
+        # Plain Text with no undo history and no wrapping: appends never snapshot
+        # undo state or re-flow lines; long lines scroll horizontally instead
+        text_frame = tk.Frame(logs_frame)
+        text_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        logs_xscroll = tk.Scrollbar(text_frame, orient=tk.HORIZONTAL)
+        logs_xscroll.pack(side=tk.BOTTOM, fill=tk.X)
+        self.logs_yscroll = tk.Scrollbar(text_frame, orient=tk.VERTICAL)
+        self.logs_yscroll.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.logs_text = tk.Text(
+            text_frame,
+            wrap=tk.NONE,
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
             font=("Consolas", 9),
             bg="#1e1e1e",
             fg="#d4d4d4",
             insertbackground="white",
-            state=tk.DISABLED
+            xscrollcommand=logs_xscroll.set,
+            yscrollcommand=self.on_logs_yscroll
         )
-        self.logs_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.logs_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        logs_xscroll.config(command=self.logs_text.xview)
+        self.logs_yscroll.config(command=self.logs_text.yview)
+        
+        # The widget stays editable for our inserts; these bindings keep it read-only for the user
+        self.logs_text.bind("<Key>", self.filter_logs_key)
+        for event in ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>", "<<Undo>>", "<<Redo>>"):
+            self.logs_text.bind(event, lambda e: "break")
         
-        # Configure search highlight tag
+        for tag, color in self.LOG_TAGS.items():
+            self.logs_text.tag_config(tag, foreground=color)
+        
+        # Configure search highlight tag (created after the log tags so it draws on top)
         self.logs_text.tag_config("search_highlight", background="#ffff00", foreground="#000000")
         self.logs_text.tag_config("current_match", background="#ff8800", foreground="#000000")
         
@@ -259,25 +367,66 @@ class LS6LogsReaderGUI:
         )
         clear_button.pack(side=tk.LEFT, padx=5, pady=5)
         
-    def log_message(self, message, color="#d4d4d4"):
-        """Add a message to the logs display"""
-        self.logs_text.config(state=tk.NORMAL)
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.logs_text.insert(tk.END, f"[{timestamp}] {message}\n", "log")
-        self.logs_text.tag_config("log", foreground=color)
-        self.logs_text.see(tk.END)
-        self.logs_text.config(state=tk.DISABLED)
+    def filter_logs_key(self, event):
+        """Let navigation and copy (Ctrl+C still reaches send_interrupt) through; block edits"""
+        if event.keysym in self.LOGS_NAVIGATION_KEYS:
+            return None
+        if event.state & 0x4 and event.keysym in self.LOGS_COPY_KEYS:
+            return None
+        return "break"
+        
+    def log_message(self, message, tag="info"):
+        """Queue a message for the logs display (safe to call from any thread)"""
+        # Format the timestamp once per second; (second, text) is swapped as one tuple
+        now = int(time.time())
+        second, timestamp = self.timestamp_cache
+        if second != now:
+            timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+            self.timestamp_cache = (now, timestamp)
+        with self.log_lock:
+            self.pending_logs.append((f"[{timestamp}] {message}\n", tag))
+            if self.flush_scheduled:
+                return
+            self.flush_scheduled = True
+        self.root.after(30, self.flush_logs)
+        
+    def flush_logs(self):
+        """Insert all pending log messages with a single widget update"""
+        with self.log_lock:
+            chunks = []
+            while self.pending_logs:
+                chunks.extend(self.pending_logs.popleft())
+            self.flush_scheduled = False
+        if chunks:
+            # Follow new output only if the view was already at the bottom (not scrolled back)
+            follow = self.logs_text.yview()[1] >= 0.999
+            # Every message ends in a newline, so new text always starts at column 0
+            appended_at = self.logs_text.index("end-1c")
+            self.logs_text.insert(tk.END, *chunks)
+            self.buffer_text = None
+            # The last index line is the empty one after the final newline
+            removed = int(self.logs_text.index("end-1c").split(".")[0]) - self.MAX_LOG_LINES - 1
+            if removed > 0:
+                self.logs_text.delete("1.0", f"{removed + 1}.0")
+                self.drop_trimmed_matches(removed)
+                appended_at = f"{max(int(appended_at.split('.')[0]) - removed, 1)}.0"
+            if self.search_term:
+                self.extend_search(appended_at)
+            if follow:
+                self.logs_text.see(tk.END)
         
     def clear_logs(self):
         """Clear the logs display"""
-        self.logs_text.config(state=tk.NORMAL)
         self.logs_text.delete(1.0, tk.END)
-        self.logs_text.config(state=tk.DISABLED)
+        self.buffer_text = None
+        with self.log_lock:
+            self.pending_logs.clear()
         self.clear_search()
         
     def clear_search(self):
         """Clear search highlights and reset search"""
         self.search_entry.delete(0, tk.END)
+        self.search_term = ""
         self.search_matches = []
         self.current_match_index = -1
         self.match_count_label.config(text="")
@@ -285,59 +434,179 @@ class LS6LogsReaderGUI:
         
     def remove_search_highlights(self):
         """Remove all search highlights"""
-        self.logs_text.config(state=tk.NORMAL)
+        if not self.has_search_tags:
+            return
+        self.has_search_tags = False
         self.logs_text.tag_remove("search_highlight", 1.0, tk.END)
         self.logs_text.tag_remove("current_match", 1.0, tk.END)
-        self.logs_text.config(state=tk.DISABLED)
+        
+    def log_buffer(self):
+        """Full text of the logs widget, cached until the next insert, trim or clear"""
+        if self.buffer_text is None:
+            self.buffer_text = self.logs_text.get("1.0", "end-1c")
+            self.buffer_lower = None
+        return self.buffer_text
+        
+    def log_buffer_lower(self):
+        """Lower-cased log text for case-insensitive search, cached alongside log_buffer"""
+        text = self.log_buffer()
+        if self.buffer_lower is None:
+            self.buffer_lower = text.lower()
+        return self.buffer_lower
+        
+    def find_matches(self, search_term, start=None):
+        """
+        Return (line, start column, end column) of every occurrence of search_term in the logs,
+        or only in the text after start (a "line.0" index) when given. The search entry is a
+        single line, so a match never spans lines.
+        """
+        if start is None:
+            text = self.log_buffer()
+            haystack = text if self.case_sensitive else self.log_buffer_lower()
+            first_line = 1
+        else:
+            text = self.logs_text.get(start, "end-1c")
+            haystack = text if self.case_sensitive else text.lower()
+            first_line = int(start.split(".")[0])
+        needle = search_term if self.case_sensitive else search_term.lower()
+            
+        if len(haystack) == len(text) and len(needle) == len(search_term):
+            # str.find uses CPython's two-way/Horspool search; offsets map 1:1 onto text
+            spans = []
+            offset = haystack.find(needle)
+            while offset >= 0:
+                end = offset + len(needle)
+                spans.append((offset, end))
+                offset = haystack.find(needle, end)
+        else:
+            # Lower-casing changed some lengths (rare non-ASCII); let the regex engine fold case
+            pattern = compile_search(search_term, self.case_sensitive)
+            spans = [match.span() for match in pattern.finditer(text)]
+        
+        line_starts = line_offsets(text)
+        matches = []
+        for offset, end in spans:
+            line = bisect.bisect_right(line_starts, offset)
+            column = offset - line_starts[line - 1]
+            matches.append((first_line + line - 1, column, column + end - offset))
+        return matches
+        
+    def refine_matches(self, search_term):
+        """
+        Narrow the current matches to those that also match search_term, which extends
+        the previous term. Returns None when the result could differ from a full scan.
+        """
+        text = self.log_buffer()
+        if self.case_sensitive:
+            haystack, previous, needle = text, self.search_term, search_term
+        else:
+            haystack, previous, needle = (self.log_buffer_lower(), self.search_term.lower(),
+                                          search_term.lower())
+        # Overlap is a property of the text actually scanned, i.e. the folded terms
+        if self_overlapping(previous) or self_overlapping(needle):
+            return None
+        if len(haystack) != len(text) or len(needle) != len(search_term):
+            return None
+            
+        line_starts = line_offsets(text)
+        matches = []
+        for line, column, _ in self.search_matches:
+            if haystack.startswith(needle, line_starts[line - 1] + column):
+                matches.append((line, column, column + len(search_term)))
+        return matches
+        
+    def extend_search(self, start):
+        """Apply the active search to the newly logged text from index start onwards"""
+        new_matches = self.find_matches(self.search_term, start)
+        self.search_matches.extend(new_matches)
+        if new_matches:
+            self.schedule_retag()
+        self.update_match_count()
+        
+    def drop_trimmed_matches(self, removed_lines):
+        """Forget matches in the first removed_lines lines and renumber the rest after a trim"""
+        dropped = bisect.bisect_left(self.search_matches, (removed_lines + 1,))
+        self.search_matches = [(line - removed_lines, start, end)
+                               for line, start, end in self.search_matches[dropped:]]
+        self.current_match_index = max(self.current_match_index - dropped, -1)
+        
+    def on_logs_yscroll(self, first, last):
+        """yscrollcommand of the logs: update the scrollbar and re-highlight the matches in view"""
+        self.logs_yscroll.set(first, last)
+        if self.search_matches:
+            self.schedule_retag()
+            
+    def schedule_retag(self):
+        """Run retag_viewport once the current burst of inserts/scrolling is done"""
+        if not self.retag_scheduled:
+            self.retag_scheduled = True
+            self.root.after_idle(self.retag_viewport)
+            
+    def retag_viewport(self):
+        """Highlight only the matches on the lines currently visible, so tag ranges stay bounded"""
+        self.retag_scheduled = False
+        first = int(self.logs_text.index("@0,0").split(".")[0])
+        last = int(self.logs_text.index(f"@0,{self.logs_text.winfo_height()}").split(".")[0])
+        if self.has_search_tags:
+            self.logs_text.tag_remove("search_highlight", 1.0, tk.END)
+        start = bisect.bisect_left(self.search_matches, (first,))
+        end = bisect.bisect_left(self.search_matches, (last + 1,))
+        if start < end:
+            self.logs_text.tag_add("search_highlight", *match_indices(self.search_matches[start:end]))
+            self.has_search_tags = True
+        
+    def update_match_count(self):
+        """Show the number of search matches"""
+        match_count = len(self.search_matches)
+        if match_count > 0:
+            self.match_count_label.config(text=f"{match_count} match{'es' if match_count != 1 else ''}")
+        else:
+            self.match_count_label.config(text="No matches")
+        
+    def schedule_search(self):
+        """Run search_text once typing pauses for SEARCH_DELAY_MS instead of on every key"""
+        if self.search_after_id is not None:
+            self.root.after_cancel(self.search_after_id)
+        self.search_after_id = self.root.after(self.SEARCH_DELAY_MS, self.search_text)
         
     def search_text(self):
         """Search for text in logs and highlight matches"""
+        if self.search_after_id is not None:
+            # Enter or a navigation button ran the search already; drop the pending one
+            self.root.after_cancel(self.search_after_id)
+            self.search_after_id = None
         search_term = self.search_entry.get()
-        self.case_sensitive = self.case_var.get()
+        case_sensitive = self.case_var.get()
+        # Typing more characters only narrows the previous matches; no rescan needed
+        refine = (self.search_term and search_term.startswith(self.search_term)
+                  and case_sensitive == self.case_sensitive)
+        self.case_sensitive = case_sensitive
         
         # Remove previous highlights
         self.remove_search_highlights()
-        self.search_matches = []
         self.current_match_index = -1
         
         if not search_term:
+            self.search_term = ""
+            self.search_matches = []
             self.match_count_label.config(text="")
             return
             
-        self.logs_text.config(state=tk.NORMAL)
-        
-        # Use text widget's search method
-        start_pos = 1.0
-        nocase = 0 if self.case_sensitive else 1
-        
-        while True:
-            # Search for the term
-            pos = self.logs_text.search(search_term, start_pos, tk.END, nocase=nocase)
-            if not pos:
-                break
-                
-            # Calculate end position
-            end_pos = f"{pos}+{len(search_term)}c"
-            
-            self.search_matches.append((pos, end_pos))
-            
-            # Highlight match
-            self.logs_text.tag_add("search_highlight", pos, end_pos)
-            
-            # Move start position for next search
-            start_pos = end_pos
+        matches = self.refine_matches(search_term) if refine else None
+        if matches is None:
+            matches = self.find_matches(search_term)
+        self.search_term = search_term
+        self.search_matches = matches
+        # Only the matches in view get tagged (retag_viewport)
+        if self.search_matches:
+            self.schedule_retag()
             
         # Update match count
-        match_count = len(self.search_matches)
-        if match_count > 0:
-            self.match_count_label.config(text=f"{match_count} match{'es' if match_count != 1 else ''}")
+        self.update_match_count()
+        if self.search_matches:
             # Go to first match
             self.current_match_index = 0
             self.highlight_current_match()
-        else:
-            self.match_count_label.config(text="No matches")
-            
-        self.logs_text.config(state=tk.DISABLED)
         
     def highlight_current_match(self):
         """Highlight the current match"""
@@ -345,16 +614,15 @@ class LS6LogsReaderGUI:
             return
             
         # Remove current match highlight from all
-        self.logs_text.config(state=tk.NORMAL)
         self.logs_text.tag_remove("current_match", 1.0, tk.END)
         
         # Highlight current match
         if 0 <= self.current_match_index < len(self.search_matches):
-            start, end = self.search_matches[self.current_match_index]
-            self.logs_text.tag_add("current_match", start, end)
-            self.logs_text.see(start)
-            
-        self.logs_text.config(state=tk.DISABLED)
+            line, start, end = self.search_matches[self.current_match_index]
+            self.logs_text.tag_add("current_match", f"{line}.{start}", f"{line}.{end}")
+            # Park the cursor on the match so next/previous continue from here
+            self.logs_text.mark_set(tk.INSERT, f"{line}.{start}")
+            self.logs_text.see(f"{line}.{start}")
         
     def search_next(self):
         """Navigate to next search match"""
@@ -362,8 +630,11 @@ class LS6LogsReaderGUI:
             self.search_text()
             return
             
-        if self.current_match_index < len(self.search_matches) - 1:
-            self.current_match_index += 1
+        # First match starting after the cursor
+        line, column = map(int, self.logs_text.index(tk.INSERT).split("."))
+        index = bisect.bisect_left(self.search_matches, (line, column + 1))
+        if index < len(self.search_matches):
+            self.current_match_index = index
         else:
             self.current_match_index = 0  # Wrap around
             
@@ -375,8 +646,11 @@ class LS6LogsReaderGUI:
             self.search_text()
             return
             
-        if self.current_match_index > 0:
-            self.current_match_index -= 1
+        # Last match starting before the cursor
+        line, column = map(int, self.logs_text.index(tk.INSERT).split("."))
+        index = bisect.bisect_left(self.search_matches, (line, column)) - 1
+        if index >= 0:
+            self.current_match_index = index
         else:
             self.current_match_index = len(self.search_matches) - 1  # Wrap around
             
@@ -395,7 +669,14 @@ class LS6LogsReaderGUI:
             port = self.port_var.get()
             baud = int(self.baud_var.get())
             
-            self.ser = serial.Serial(port, baud, timeout=0.1)
+            # Reads return after READ_IDLE_TIMEOUT without data, so a partial line can be shown
+            self.ser = serial.Serial(port, baud, timeout=self.READ_IDLE_TIMEOUT)
+            # 1 ms USB latency timer where the driver supports it (pyserial has no such call on Windows)
+            if hasattr(self.ser, "set_low_latency_mode"):
+                try:
+                    self.ser.set_low_latency_mode(True)
+                except (OSError, ValueError, NotImplementedError):
+                    pass
             self.is_connected = True
             self.stop_reading = False
             
@@ -403,7 +684,7 @@ class LS6LogsReaderGUI:
             self.conn_button.config(text="Disconnect", bg="#e74c3c")
             self.status_label.config(text="● Connected", fg="#27ae60")
             
-            self.log_message(f"Connected to {port} at {baud} baud", "#27ae60")
+            self.log_message(f"Connected to {port} at {baud} baud", "ok")
             
             # Start reading thread
             self.read_thread = threading.Thread(target=self.read_serial, daemon=True)
@@ -412,55 +693,166 @@ class LS6LogsReaderGUI:
         except ValueError:
             messagebox.showerror("Error", "Invalid baud rate. Please enter a number.")
         except Exception as e:
+            if self.ser and self.ser.is_open and not self.is_connected:
+                # Opened but setup failed: release the port so a retry can open it
+                self.ser.close()
             messagebox.showerror("Connection Error", f"Could not open serial port:\n{e}")
-            self.log_message(f"Connection error: {e}", "#e74c3c")
+            self.log_message(f"Connection error: {e}", "err")
             
     def disconnect(self):
         """Disconnect from serial port"""
         self.stop_reading = True
         self.is_connected = False
+        if self.wake_pipe:
+            os.write(self.wake_pipe[1], b"\0")
         
         if self.ser and self.ser.is_open:
+            if hasattr(self.ser, "cancel_read"):
+                # Release a reader blocked in ser.read() (pyserial >= 3.1)
+                self.ser.cancel_read()
             self.ser.close()
             
         # Update UI
         self.conn_button.config(text="Connect", bg="#27ae60")
         self.status_label.config(text="● Disconnected", fg="#e74c3c")
         
-        self.log_message("Disconnected from serial port", "#e74c3c")
+        self.log_message("Disconnected from serial port", "err")
+        
+    def serial_fd(self):
+        """Return the OS file descriptor of the serial port, or None where select() can't use it (Windows)"""
+        try:
+            fd = self.ser.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+        return fd if os.name == "posix" else None
+        
+    def drain_wake_pipe(self):
+        """Discard pending wake-up bytes"""
+        try:
+            while os.read(self.wake_pipe[0], 64):
+                pass
+        except BlockingIOError:
+            pass
+            
+    def extract_messages(self, buffer):
+        """
+        Remove complete messages from the front of buffer and return them as text.
+        Handles newline-terminated log lines and length-framed Dynamixel status packets
+        (FF FF ID LEN ...); 0xFF never occurs in UTF-8 text, so the two can't be confused.
+        """
+        messages = []
+        while buffer:
+            header = buffer.find(b"\xff\xff")
+            if header == 0:
+                # Wait for ID and LEN, then for LEN more bytes (instruction/error, params, checksum)
+                if len(buffer) < 4 or len(buffer) < buffer[3] + 4:
+                    break
+                end = buffer[3] + 4
+                messages.append(f"[DXL] {buffer[:end].hex()}")
+                del buffer[:end]
+                continue
+            # Text runs up to the next frame, or to the last complete line; text left
+            # before a frame has no newline and is emitted as its own line
+            end = header if header > 0 else buffer.rfind(b"\n") + 1
+            if not end:
+                break
+            # One decode and split for the whole run instead of one per line
+            text = buffer[:end].decode("utf-8", errors="ignore")
+            del buffer[:end]
+            messages.extend(filter(None, map(str.strip, text.split("\n"))))
+        return messages
+        
+    def extract_partial(self, buffer):
+        """
+        Remove the unterminated text at the front of buffer once the port went idle and
+        return it as a message list. A partial status packet (from 0xFF on) stays buffered.
+        """
+        end = buffer.find(b"\xff")
+        if end < 0:
+            end = len(buffer)
+        text = buffer[:end].decode("utf-8", errors="ignore").strip()
+        del buffer[:end]
+        return [text] if text else []
         
     def read_serial(self):
         """Read from serial port in a separate thread"""
+        fd = self.serial_fd()
+        selector = None
+        if fd is not None:
+            # epoll/kqueue where available; wakes on serial data or on disconnect()'s wake byte
+            selector = selectors.DefaultSelector()
+            selector.register(fd, selectors.EVENT_READ)
+            selector.register(self.wake_pipe[0], selectors.EVENT_READ, "wake")
+            self.drain_wake_pipe()
+        try:
+            self.read_loop(fd, selector)
+        finally:
+            if selector is not None:
+                selector.close()
+                
+    def read_loop(self, fd, selector):
+        """Body of read_serial: read raw bytes (straight from fd when selector is given) and log messages"""
+        # is_connected is the cached open flag (cleared by disconnect() before the port closes),
+        # so the loop doesn't re-check ser.is_open per read; a closed port raises below
+        ser = self.ser
+        buffer = bytearray()
         while not self.stop_reading and self.is_connected:
             try:
-                if self.ser and self.ser.is_open:
-                    line = self.ser.readline()
-                    if line:
-                        try:
-                            text = line.decode("utf-8", errors="ignore").strip()
-                            if text:
-                                self.root.after(0, self.log_message, text)
-                        except:
-                            pass
+                if selector is not None:
+                    events = selector.select(self.READ_IDLE_TIMEOUT if buffer else None)
+                    if any(key.data == "wake" for key, _ in events):
+                        self.drain_wake_pipe()
+                        continue
+                    if events:
+                        # One syscall per burst; bypasses pyserial's read() wrapper
+                        chunk = os.read(fd, 65536)
+                        if not chunk:
+                            raise serial.SerialException("device reports readiness to read but returned no data")
+                    else:
+                        chunk = b""
                 else:
-                    break
+                    chunk = ser.read(ser.in_waiting or 1)
+                if chunk:
+                    buffer += chunk
+                    messages = self.extract_messages(buffer)
+                elif buffer:
+                    # Idle with text still buffered: show the partial line (e.g. a shell prompt)
+                    messages = self.extract_partial(buffer)
+                else:
+                    continue
+                for text in messages:
+                    self.log_message(text)
             except Exception as e:
                 if not self.stop_reading:
-                    self.root.after(0, self.log_message, f"Read error: {e}", "#e74c3c")
+                    self.log_message(f"Read error: {e}", "err")
                 time.sleep(0.1)
                 
+    def write_serial(self):
+        """Write queued data to the serial port in a separate thread"""
+        while True:
+            chunks = [self.tx_queue.get()]
+            # Coalesce everything already queued into one write
+            while True:
+                try:
+                    chunks.append(self.tx_queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                if self.ser and self.ser.is_open:
+                    self.ser.write(b"".join(chunks))
+            except Exception as e:
+                self.log_message(f"Send error: {e}", "err")
+                
     def send_interrupt(self):
         """Send Ctrl+C interrupt signal to serial port"""
         if not self.is_connected or not self.ser or not self.ser.is_open:
             return  # Silently return if not connected
             
         try:
-            # Send Ctrl+C (ASCII 0x03, interrupt character)
-            interrupt_char = b'\x03'
-            self.ser.write(interrupt_char)
-            self.log_message(">>> [Ctrl+C] Interrupt signal sent", "#ff8800")
+            self.tx_queue.put(self.CTRL_C)
+            self.log_message(">>> [Ctrl+C] Interrupt signal sent", "interrupt")
         except Exception as e:
-            self.log_message(f"Interrupt send error: {e}", "#e74c3c")
+            self.log_message(f"Interrupt send error: {e}", "err")
     
     def send_command(self):
         """Send command to serial port"""
@@ -473,18 +865,19 @@ class LS6LogsReaderGUI:
         self.cmd_entry.delete(0, tk.END)
         
         try:
+            payload = command.encode('utf-8')
             # Add newline if not present (even for empty commands)
-            if not command.endswith('\n'):
-                command += '\n'
+            if not payload.endswith(b'\n'):
+                payload += b'\n'
                 
-            self.ser.write(command.encode('utf-8'))
+            self.tx_queue.put(payload)
             # Display sent command (show as "(empty)" if just newline)
             display_cmd = command.strip() if command.strip() else "(empty)"
-            self.log_message(f">>> {display_cmd}", "#3498db")
+            self.log_message(f">>> {display_cmd}", "sent")
             
         except Exception as e:
             messagebox.showerror("Send Error", f"Could not send command:\n{e}")
-            self.log_message(f"Send error: {e}", "#e74c3c")
+            self.log_message(f"Send error: {e}", "err")
 
 
 def main():
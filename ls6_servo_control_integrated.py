@@ -4,16 +4,68 @@ LS6 Integrated Logs Reader and Servo Control
 Combines serial log reading with USB-based servo control
 """
 
+import bisect
+import collections
+import functools
+import itertools
+import re
 import serial
-import time
 import threading
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 from datetime import datetime
-from robot_servo_control_usb import RobotServoControllerUSB
+from robot_servo_control_usb import RobotServoControllerUSB, enable_low_latency
 
 
+@functools.lru_cache(maxsize=32)
+def compile_search(search_term, case_sensitive):
+    """Compiled literal pattern for a search term, cached across keystrokes"""
+    return re.compile(re.escape(search_term), 0 if case_sensitive else re.IGNORECASE)
+
+def span_indices(matches, line_starts):
+    """Convert regex matches to (start, end) "line.column" Tk index pairs"""
+    pairs = []
+    for match in matches:
+        indices = []
+        for offset in match.span():
+            line = bisect.bisect_right(line_starts, offset)
+            indices.append(f"{line}.{offset - line_starts[line - 1]}")
+        pairs.append(tuple(indices))
+    return pairs
+
+def shift_indices(pairs, removed_lines):
+    """Drop the index pairs in the first removed_lines lines and renumber the rest after a trim"""
+    if not removed_lines:
+        return pairs
+    shifted = []
+    for pair in pairs:
+        if int(pair[0].split(".")[0]) > removed_lines:
+            shifted.append(tuple(f"{int(line) - removed_lines}.{column}"
+                                 for line, column in (index.split(".") for index in pair)))
+    return shifted
+
 class LS6IntegratedControl:
+    # Shared, immutable pose tuples for the preset buttons and motor tests
+    PRESET_POSITIONS = (
+        ("90°", (90,) * 12),
+        ("150°", (150,) * 12),
+        ("180°", (180,) * 12),
+        ("210°", (210,) * 12),
+    )
+    ALL_180 = (180,) * 12
+    
+    # Oldest log lines are trimmed beyond this to keep memory and redraw cost bounded
+    MAX_LOG_LINES = 20000
+    
+    # Typing in the search box re-runs the search after this much idle time
+    SEARCH_DELAY_MS = 200
+    
+    # Matches found by the background search are highlighted in batches of this size
+    SEARCH_BATCH = 100
+    
+    # Most log lines waiting for the next flush before the oldest are dropped
+    MAX_PENDING_LOGS = 10000
+    
     def __init__(self, root):
         self.root = root
         self.root.title("LS6 Integrated Control - Logs & Servos")
@@ -42,6 +94,26 @@ class LS6IntegratedControl:
         self.search_matches = []
         self.current_match_index = -1
         self.case_sensitive = False
+        # Pending debounced search started from typing (root.after id)
+        self.search_after_id = None
+        # Bumped whenever matches become stale, so late background results are dropped
+        self.search_generation = 0
+        # True while the background part of the current search is still running
+        self.search_running = False
+        # Lines trimmed from the top of the logs so far; background results are shifted by
+        # the lines trimmed since their search started
+        self.trimmed_lines = 0
+        
+        # Log lines are queued here (from any thread) and inserted in batches by flush_logs,
+        # which the first message of each batch schedules for the next idle moment after 50ms.
+        # deque append/popleft are atomic, so no lock is needed. When the UI falls behind,
+        # the oldest queued lines are dropped beyond MAX_PENDING_LOGS.
+        self.pending_logs = collections.deque(maxlen=self.MAX_PENDING_LOGS)
+        self.flush_scheduled = False
+        
+        # Cached widget text and line start offsets for search (None = stale)
+        self.buffer_text = None
+        self.line_starts = None
         
         self.create_widgets()
         
@@ -139,7 +211,7 @@ class LS6IntegratedControl:
         self.search_entry = tk.Entry(search_frame, font=("Arial", 8), width=15)
         self.search_entry.pack(side=tk.LEFT, padx=2)
         self.search_entry.bind("<Return>", lambda e: self.search_text())
-        self.search_entry.bind("<KeyRelease>", lambda e: self.search_text())
+        self.search_entry.bind("<KeyRelease>", lambda e: self.schedule_search())
         
         self.case_var = tk.BooleanVar()
         tk.Checkbutton(
@@ -193,11 +265,17 @@ class LS6IntegratedControl:
         )
         self.logs_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        self.logs_text.tag_config("search_highlight", background="#ffff00", foreground="#000000")
-        self.logs_text.tag_config("current_match", background="#ff8800", foreground="#000000")
         self.logs_text.tag_config("servo_cmd", foreground="#00ff00")
         self.logs_text.tag_config("servo_error", foreground="#ff4444")
         
+        # One tag per log color (see color_tag), so coloring a line never recolors earlier ones
+        self.logs_text.tag_config("log", foreground="#d4d4d4")
+        self.color_tags = {"#d4d4d4": "log"}
+        
+        # Search tags are created after the log tags so they draw on top
+        self.logs_text.tag_config("search_highlight", background="#ffff00", foreground="#000000")
+        self.logs_text.tag_config("current_match", background="#ff8800", foreground="#000000")
+        
         # Command input frame
         cmd_frame = tk.Frame(parent, bg="#ecf0f1", relief=tk.RAISED, bd=2)
         cmd_frame.pack(fill=tk.X, pady=5)
@@ -369,14 +447,7 @@ class LS6IntegratedControl:
         preset_frame = tk.LabelFrame(parent, text="Preset Positions", bg="#ecf0f1", font=("Arial", 9, "bold"))
         preset_frame.pack(fill=tk.X, pady=5, padx=5)
         
-        presets = [
-            ("90°", [90] * 12),
-            ("150°", [150] * 12),
-            ("180°", [180] * 12),
-            ("210°", [210] * 12),
-        ]
-        
-        for name, positions in presets:
+        for name, positions in self.PRESET_POSITIONS:
             btn = tk.Button(
                 preset_frame,
                 text=name,
@@ -390,26 +461,81 @@ class LS6IntegratedControl:
         
     # Logs methods
     def log_message(self, message, color="#d4d4d4", tag=""):
-        """Add a message to the logs display"""
-        self.logs_text.config(state=tk.NORMAL)
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        tag_name = tag if tag else "log"
-        self.logs_text.insert(tk.END, f"[{timestamp}] {message}\n", tag_name)
-        if tag_name not in ["servo_cmd", "servo_error"]:
+        """Queue a message for the logs display (safe to call from any thread)"""
+        # Append before checking the flag: flush_logs clears the flag before draining,
+        # so a message is either drained by a running flush or schedules a new one
+        self.pending_logs.append((message, tag, color))
+        if not self.flush_scheduled:
+            self.flush_scheduled = True
+            self.root.after(50, self.root.after_idle, self.flush_logs)
+        
+    def color_tag(self, color):
+        """Tag for untagged lines of the given color, configured the first time the color is used"""
+        tag_name = self.color_tags.get(color)
+        if tag_name is None:
+            tag_name = self.color_tags[color] = f"log_{color.lstrip('#')}"
             self.logs_text.tag_config(tag_name, foreground=color)
-        self.logs_text.see(tk.END)
+            self.logs_text.tag_lower(tag_name, "search_highlight")
+        return tag_name
+        
+    def flush_logs(self):
+        """Insert all pending log messages with a single widget update"""
+        self.flush_scheduled = False
+        pending = []
+        try:
+            while True:
+                pending.append(self.pending_logs.popleft())
+        except IndexError:
+            pass
+        if not pending:
+            return
+        # One timestamp per batch: lines flushed together arrived within the same 50 ms
+        prefix = f"[{datetime.now().strftime('%H:%M:%S')}] "
+        # Consecutive lines with the same tag become one joined string (one insert text/tag pair)
+        chunks = []
+        runs = itertools.groupby(pending, key=lambda item: item[1] or self.color_tag(item[2]))
+        for tag_name, run in runs:
+            chunks += (prefix + ("\n" + prefix).join(message for message, _, _ in run) + "\n", tag_name)
+        # Follow new output only if the view was already at the bottom (not scrolled back)
+        follow = self.logs_text.yview()[1] >= 0.999
+        self.logs_text.config(state=tk.NORMAL)
+        self.logs_text.insert(tk.END, *chunks)
+        self.buffer_text = None
+        # The last index line is the empty one after the final newline
+        removed = int(self.logs_text.index("end-1c").split(".")[0]) - self.MAX_LOG_LINES - 1
+        if removed > 0:
+            self.logs_text.delete("1.0", f"{removed + 1}.0")
+            self.trimmed_lines += removed
+            self.drop_trimmed_matches(removed)
+        if follow:
+            self.logs_text.see(tk.END)
         self.logs_text.config(state=tk.DISABLED)
         
+    def drop_trimmed_matches(self, removed_lines):
+        """Forget matches in the first removed_lines lines and renumber the rest after a trim"""
+        if not self.search_matches:
+            return
+        matches = shift_indices(self.search_matches, removed_lines)
+        dropped = len(self.search_matches) - len(matches)
+        self.search_matches = matches
+        self.current_match_index = max(self.current_match_index - dropped, -1)
+        if not self.search_running:
+            self.update_match_count()
+        
     def clear_logs(self):
         """Clear the logs display"""
         self.logs_text.config(state=tk.NORMAL)
         self.logs_text.delete(1.0, tk.END)
         self.logs_text.config(state=tk.DISABLED)
+        self.buffer_text = None
+        self.pending_logs.clear()
         self.clear_search()
         
     def clear_search(self):
         """Clear search highlights"""
         self.search_entry.delete(0, tk.END)
+        self.search_generation += 1
+        self.search_running = False
         self.search_matches = []
         self.current_match_index = -1
         self.match_count_label.config(text="")
@@ -422,12 +548,32 @@ class LS6IntegratedControl:
         self.logs_text.tag_remove("current_match", 1.0, tk.END)
         self.logs_text.config(state=tk.DISABLED)
         
+    def log_buffer(self):
+        """Full text of the logs widget, cached with its line start offsets until the logs change"""
+        if self.buffer_text is None:
+            self.buffer_text = self.logs_text.get("1.0", "end-1c")
+            self.line_starts = [0]
+            self.line_starts.extend(itertools.accumulate(len(line) + 1 for line in self.buffer_text.split("\n")))
+        return self.buffer_text
+        
+    def schedule_search(self):
+        """Run search_text once typing pauses for SEARCH_DELAY_MS instead of on every key"""
+        if self.search_after_id is not None:
+            self.root.after_cancel(self.search_after_id)
+        self.search_after_id = self.root.after(self.SEARCH_DELAY_MS, self.search_text)
+        
     def search_text(self):
         """Search for text in logs"""
+        if self.search_after_id is not None:
+            # Enter or a navigation button ran the search already; drop the pending one
+            self.root.after_cancel(self.search_after_id)
+            self.search_after_id = None
         search_term = self.search_entry.get()
         self.case_sensitive = self.case_var.get()
         
         self.remove_search_highlights()
+        self.search_generation += 1
+        self.search_running = False
         self.search_matches = []
         self.current_match_index = -1
         
@@ -435,29 +581,81 @@ class LS6IntegratedControl:
             self.match_count_label.config(text="")
             return
             
-        self.logs_text.config(state=tk.NORMAL)
-        
-        start_pos = 1.0
-        nocase = 0 if self.case_sensitive else 1
-        
-        while True:
-            pos = self.logs_text.search(search_term, start_pos, tk.END, nocase=nocase)
-            if not pos:
-                break
-            end_pos = f"{pos}+{len(search_term)}c"
-            self.search_matches.append((pos, end_pos))
-            self.logs_text.tag_add("search_highlight", pos, end_pos)
-            start_pos = end_pos
+        text = self.log_buffer()
+        line_starts = self.line_starts
+        pattern = compile_search(search_term, self.case_sensitive)
+        
+        # Scan the lines on screen right away; a background thread scans the rest of the buffer
+        first = int(self.logs_text.index("@0,0").split(".")[0])
+        last = int(self.logs_text.index(f"@0,{self.logs_text.winfo_height()}").split(".")[0])
+        lo = line_starts[first - 1]
+        hi = line_starts[min(last, len(line_starts) - 1)]
+        self.search_matches = span_indices(pattern.finditer(text, lo, hi), line_starts)
+        # Tk's tag add takes any number of start/end pairs: one call for every match
+        if self.search_matches:
+            self.logs_text.tag_add("search_highlight", *itertools.chain.from_iterable(self.search_matches))
+        self.match_count_label.config(text="Searching...")
+        self.search_running = True
+        
+        # The scan runs against this snapshot of the buffer; its indices are shifted by the
+        # lines trimmed after this point when they reach the UI
+        threading.Thread(
+            target=self.search_rest,
+            args=(self.search_generation, self.trimmed_lines, pattern, text, line_starts, lo, hi),
+            daemon=True
+        ).start()
+        
+    def search_rest(self, generation, trimmed, pattern, text, line_starts, lo, hi):
+        """Background part of search_text: find the matches before offset lo and from hi on"""
+        before = self.post_matches(generation, trimmed, pattern.finditer(text, 0, lo), line_starts)
+        after = self.post_matches(generation, trimmed, pattern.finditer(text, hi), line_starts)
+        if before is not None and after is not None:
+            self.root.after(0, self.finish_search, generation, trimmed, before, after)
             
+    def post_matches(self, generation, trimmed, matches, line_starts):
+        """Convert matches in SEARCH_BATCH-sized batches, posting each to the UI to highlight.
+        Returns all of them, or None if a newer search made them stale."""
+        pairs = []
+        while generation == self.search_generation:
+            batch = span_indices(itertools.islice(matches, self.SEARCH_BATCH), line_starts)
+            if not batch:
+                return pairs
+            pairs += batch
+            self.root.after(0, self.add_match_batch, generation, trimmed, batch)
+        return None
+        
+    def add_match_batch(self, generation, trimmed, batch):
+        """Highlight a batch of background search matches"""
+        if generation == self.search_generation:
+            batch = shift_indices(batch, self.trimmed_lines - trimmed)
+            if batch:
+                self.logs_text.tag_add("search_highlight", *itertools.chain.from_iterable(batch))
+            
+    def finish_search(self, generation, trimmed, before, after):
+        """Merge background matches around the visible ones and show the final count"""
+        if generation != self.search_generation:
+            return
+        self.search_running = False
+        # Matches in lines trimmed while the scan ran are dropped, the rest renumbered
+        before = shift_indices(before, self.trimmed_lines - trimmed)
+        after = shift_indices(after, self.trimmed_lines - trimmed)
+        if self.current_match_index >= 0:
+            # Keep the match the user already navigated to while the scan ran
+            self.current_match_index += len(before)
+        self.search_matches = before + self.search_matches + after
+        
+        self.update_match_count()
+        if self.search_matches and self.current_match_index < 0:
+            self.current_match_index = 0
+            self.highlight_current_match()
+        
+    def update_match_count(self):
+        """Show the number of search matches"""
         match_count = len(self.search_matches)
         if match_count > 0:
             self.match_count_label.config(text=f"{match_count} match{'es' if match_count != 1 else ''}")
-            self.current_match_index = 0
-            self.highlight_current_match()
         else:
             self.match_count_label.config(text="No matches")
-            
-        self.logs_text.config(state=tk.DISABLED)
         
     def highlight_current_match(self):
         """Highlight current match"""
@@ -506,7 +704,9 @@ class LS6IntegratedControl:
             port = self.port_var.get()
             baud = int(self.baud_var.get())
             
+            # Reads return after 0.1 s without data, so an unterminated prompt is still shown
             self.ser = serial.Serial(port, baud, timeout=0.1)
+            enable_low_latency(self.ser)
             self.is_connected = True
             self.stop_reading = False
             
@@ -521,6 +721,9 @@ class LS6IntegratedControl:
         except ValueError:
             messagebox.showerror("Error", "Invalid baud rate. Please enter a number.")
         except Exception as e:
+            if self.ser and self.ser.is_open and not self.is_connected:
+                # Opened but setup failed: release the port so a retry can open it
+                self.ser.close()
             messagebox.showerror("Connection Error", f"Could not open serial port:\n{e}")
             self.log_message(f"Connection error: {e}", "#e74c3c")
             
@@ -530,6 +733,9 @@ class LS6IntegratedControl:
         self.is_connected = False
         
         if self.ser and self.ser.is_open:
+            if hasattr(self.ser, "cancel_read"):
+                # Release the reader waiting in read() (pyserial >= 3.1)
+                self.ser.cancel_read()
             self.ser.close()
             
         self.conn_button.config(text="Connect Logs", bg="#27ae60")
@@ -539,24 +745,40 @@ class LS6IntegratedControl:
         
     def read_serial(self):
         """Read from serial port"""
+        # is_connected is the cached open flag (cleared by disconnect() before the port closes),
+        # so the loop doesn't re-check ser.is_open per read; a closed port raises below
+        ser = self.ser
+        buffer = bytearray()
         while not self.stop_reading and self.is_connected:
             try:
-                if self.ser and self.ser.is_open:
-                    line = self.ser.readline()
-                    if line:
-                        try:
-                            text = line.decode("utf-8", errors="ignore").strip()
-                            if text:
-                                self.root.after(0, self.log_message, text)
-                        except:
-                            pass
+                # Take everything already received in one read (or wait up to the timeout for a byte)
+                chunk = ser.read(ser.in_waiting or 1)
+                if chunk:
+                    buffer += chunk
+                    # Decode and split every complete line in the buffer at once; keep the partial tail
+                    end = buffer.rfind(b"\n") + 1
+                elif buffer:
+                    # Nothing more within the timeout: show the partial line (e.g. a shell prompt)
+                    end = len(buffer)
                 else:
-                    break
-            except Exception as e:
+                    continue
+                if end:
+                    text = buffer[:end].decode("utf-8", errors="ignore")
+                    del buffer[:end]
+                    for line in filter(None, map(str.strip, text.split("\n"))):
+                        self.log_message(line)
+            except (serial.SerialException, OSError) as e:
+                # Port failures don't recover by retrying; hand off to the UI thread and stop
                 if not self.stop_reading:
-                    self.root.after(0, self.log_message, f"Read error: {e}", "#e74c3c")
-                time.sleep(0.1)
+                    self.root.after(0, self.handle_serial_error, e)
+                return
                 
+    def handle_serial_error(self, error):
+        """Report a failed logs port and disconnect cleanly (runs on the Tk thread)"""
+        self.log_message(f"Read error: {error}", "#e74c3c")
+        if self.is_connected:
+            self.disconnect()
+            
     def send_interrupt(self):
         """Send Ctrl+C interrupt"""
         if not self.is_connected or not self.ser or not self.ser.is_open:
@@ -577,9 +799,10 @@ class LS6IntegratedControl:
         self.cmd_entry.delete(0, tk.END)
         
         try:
-            if not command.endswith('\n'):
-                command += '\n'
-            self.ser.write(command.encode('utf-8'))
+            payload = command.encode('utf-8')
+            if not payload.endswith(b'\n'):
+                payload += b'\n'
+            self.ser.write(payload)
             display_cmd = command.strip() if command.strip() else "(empty)"
             self.log_message(f">>> {display_cmd}", "#3498db")
         except Exception as e:
@@ -647,19 +870,25 @@ class LS6IntegratedControl:
             return
             
         self.log_message("Testing motor 1...", "#00ff00", "servo_cmd")
-        positions = [180, 120, 150]
-        for pos in positions:
-            success = self.servo_controller.send_servo_positions(
-                motor_ids=[1],
-                motor_types=[RobotServoControllerUSB.MOTORTYPE_AX12],
-                positions_degrees=[pos],
-                velocities_rpm=[30.0]
-            )
-            if success:
-                self.log_message(f"  Motor 1 moved to {pos}°", "#00ff00", "servo_cmd")
-            else:
-                self.log_message(f"  Failed to move motor 1 to {pos}°", "#ff4444", "servo_error")
-            time.sleep(1)
+        self.test_motor_1_step([180, 120, 150])
+        
+    def test_motor_1_step(self, positions, index=0):
+        """Send one position of the motor 1 test and schedule the next a second later (keeps the UI live)"""
+        if not self.servo_connected:
+            return
+        pos = positions[index]
+        success = self.servo_controller.send_servo_positions(
+            motor_ids=[1],
+            motor_types=[RobotServoControllerUSB.MOTORTYPE_AX12],
+            positions_degrees=[pos],
+            velocities_rpm=[30.0]
+        )
+        if success:
+            self.log_message(f"  Motor 1 moved to {pos}°", "#00ff00", "servo_cmd")
+        else:
+            self.log_message(f"  Failed to move motor 1 to {pos}°", "#ff4444", "servo_error")
+        if index + 1 < len(positions):
+            self.root.after(1000, self.test_motor_1_step, positions, index + 1)
             
     def test_all_motors(self):
         """Test all motors"""
@@ -668,12 +897,11 @@ class LS6IntegratedControl:
             return
             
         self.log_message("Testing all motors...", "#00ff00", "servo_cmd")
-        positions = [180] * 12
-        success = self.servo_controller.send_all_servos(positions)
+        success = self.servo_controller.send_all_servos(self.ALL_180)
         if success:
             self.log_message("✓ All motors moved to 180°", "#00ff00", "servo_cmd")
-            time.sleep(2)
-            self.move_to_neutral()
+            # Return to neutral after 2s without blocking the Tk event loop
+            self.root.after(2000, lambda: self.servo_connected and self.move_to_neutral())
         else:
             self.log_message("✗ Failed to move all motors", "#ff4444", "servo_error")
             
@@ -717,7 +945,7 @@ class LS6IntegratedControl:
             messagebox.showwarning("Not Connected", "Please connect to servo controller first.")
             return
             
-        self.log_message(f"Moving all servos to preset positions: {positions[:3]}...", "#00ff00", "servo_cmd")
+        self.log_message(f"Moving all servos to preset positions: {list(positions[:3])}...", "#00ff00", "servo_cmd")
         success = self.servo_controller.send_all_servos(positions)
         if success:
             self.log_message("✓ All servos command sent successfully", "#00ff00", "servo_cmd")
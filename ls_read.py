@@ -1,3 +1,5 @@
+import sys
+
 import serial
 
 # Change this to your actual port:
@@ -8,14 +10,38 @@ PORT = "COM17"
 BAUD = 57600
 
 ser = serial.Serial(PORT, BAUD, timeout=0.5)
+# 1 ms USB latency timer where the driver supports it (pyserial has no such call on Windows)
+if hasattr(ser, "set_low_latency_mode"):
+    try:
+        ser.set_low_latency_mode(True)
+    except (OSError, ValueError, NotImplementedError):
+        pass
 
 print(f"Listening on {PORT} at {BAUD} baud...\n")
 
+# Raw bytes go straight to the stdout buffer; it is flushed only once the port is drained
+out = sys.stdout.buffer
+buffer = bytearray()
+
+def write_line(line):
+    out.write(line.hex().encode("ascii") + b"    |    " + line + b"\n")
+
 while True:
     try:
-        line = ser.readline()
-        if line:
-            print(line.hex(), "   |   ", line.decode(errors="ignore"))
+        # Take everything already received in one read (or wait up to the timeout for a byte)
+        chunk = ser.read(ser.in_waiting or 1)
+        if chunk:
+            buffer += chunk
+            while b"\n" in buffer:
+                line, _, buffer = buffer.partition(b"\n")
+                write_line(bytes(line) + b"\n")
+        elif buffer:
+            # Nothing more within the timeout: show the partial line, as readline() did
+            write_line(bytes(buffer))
+            buffer.clear()
+        if not ser.in_waiting:
+            out.flush()
     except KeyboardInterrupt:
+        out.flush()
         print("Stopped.")
         break
@@ -5,11 +5,14 @@ Controls Dynamixel servos (AX-12, AX-18, MX-28, MX-64, MX-106) through LUCI prot
 Compatible with the Android app's communication protocol
 """
 
+import logging
 import socket
 import struct
 import time
 from typing import List, Tuple, Optional
 
+logger = logging.getLogger(__name__)
+
 
 class RobotServoController:
     """Controller for robot servos via TCP/IP using LUCI protocol"""
@@ -24,10 +27,26 @@ class RobotServoController:
     
     # Baud rates (matching Java code)
     BAUDRATES = [2000000, 1000000, 500000, 222222, 117647, 100000, 57142, 9615]
+    BAUD_TO_INDEX = {baud: index for index, baud in enumerate(BAUDRATES)}
+    
+    # Degrees/RPM -> motor value as (pos_range, pos_max, vel_range, vel_max);
+    # AX: 0-300° -> 0-1023, 0-114 RPM -> 0-1023. MX: 0-360° -> 0-4095, 0-117 RPM -> 0-1023
+    AX_SCALE = (300.0, 1023.0, 114.0, 1023.0)
+    MX_SCALE = (360.0, 4095.0, 117.0, 1023.0)
+    MOTOR_SCALES = {MOTORTYPE_AX12: AX_SCALE, MOTORTYPE_AX18: AX_SCALE}
+    
+    # Packets kept in each controller's packet cache before it is cleared
+    PACKET_CACHE_SIZE = 256
     
     # Dynamixel register addresses
     GOAL_POSITION_ADDR = 30  # Start address for goal position
     
+    # Precompiled packers (skip format-string parsing on every call)
+    U16_LE = struct.Struct('<H')
+    POS_VEL_LE = struct.Struct('<HH')  # goal position + moving speed
+    # LUCI header: 0,0,2, module (LE u16), 0,0,0, length (LE u16), mode, packet0 len, packet1 len
+    LUCI_HEADER = struct.Struct('<2xBH3xHBHH')
+    
     def __init__(self, ip_address: str, port: int = 7777):
         """
         Initialize robot controller
@@ -40,36 +59,57 @@ class RobotServoController:
         self.port = port
         self.socket: Optional[socket.socket] = None
         self.connected = False
+        # Minimum gap between position commands, as the Android app waits 35 ms;
+        # lower it with set_min_interval() once a controller is measured to keep up
+        self.min_interval = 0.035
+        self.last_send_time = 0.0
+        # Built packets keyed by command tuple, so repeated poses skip packet assembly
+        self.packet_cache = {}
+        
+    def connect(
+        self,
+        debug: bool = False,
+        socket_options: Optional[List[Tuple[int, int, int]]] = None
+    ) -> bool:
+        """
+        Connect to robot controller via TCP/IP
         
-    def connect(self, debug: bool = False) -> bool:
-        """Connect to robot controller via TCP/IP"""
+        Args:
+            debug: Print connection details
+            socket_options: Optional extra (level, optname, value) tuples passed to setsockopt
+        """
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Commands are tiny packets sent back-to-back: disable Nagle so each goes out immediately
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Small send buffer: packets are tiny, so there is nothing for the kernel to coalesce
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 8192)
+            # Detect a dead controller within ~1 min instead of stalling on a half-open connection
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for option, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
+                if hasattr(socket, option):
+                    self.socket.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+            # Caller options come last so they can override any of the above
+            for level, optname, value in socket_options or ():
+                self.socket.setsockopt(level, optname, value)
             self.socket.settimeout(5.0)
             if debug:
                 print(f"Connecting to {self.ip_address}:{self.port}...")
             self.socket.connect((self.ip_address, self.port))
             
-            # Send registration packet (matching Android app - sent as STRING in Java)
-            # The Android app uses PrintWriter for registration, DataOutputStream for commands
+            # Send registration packet (the Android app writes the same bytes via PrintWriter)
             register_packet = bytes([0, 0, 2, 3, 0, 0, 0, 0, 0, 0])
-            # Try sending as string first (matching Android app behavior)
-            try:
-                register_str = register_packet.decode('utf-8', errors='ignore')
-                self.socket.send(register_str.encode('utf-8'))
-            except:
-                # Fallback to raw bytes
-                self.socket.send(register_packet)
+            self.socket.sendall(register_packet)
             
-            time.sleep(0.5)
-            
-            # Read any response
+            # Read any response, returning as soon as the controller answers
+            self.socket.settimeout(0.2)
             try:
                 response = self.socket.recv(1024)
                 if debug and response:
                     print(f"Registration response: {response.hex()}")
-            except:
+            except socket.timeout:
                 pass
+            self.socket.settimeout(5.0)
             
             self.connected = True
             print(f"✓ Connected to robot at {self.ip_address}:{self.port}")
@@ -85,22 +125,33 @@ class RobotServoController:
         if self.socket:
             try:
                 self.socket.close()
-            except:
+            except OSError:
                 pass
         self.connected = False
         print("Disconnected from robot")
     
+    def set_min_interval(self, seconds: float):
+        """Set the minimum gap between consecutive position commands"""
+        self.min_interval = max(0.0, seconds)
+    
+    def _wait_send_slot(self):
+        """Sleep only as long as needed to keep min_interval since the last send"""
+        delay = self.last_send_time + self.min_interval - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self.last_send_time = time.monotonic()
+    
     def _get_little_endian_bytes(self, value: int) -> bytes:
         """Convert integer to little-endian 2-byte array"""
-        return struct.pack('<H', value & 0xFFFF)
+        return self.U16_LE.pack(value & 0xFFFF)
     
     def _get_baud_rate_index(self, baud_rate: int) -> int:
         """Get baud rate index from baud rate value"""
-        try:
-            return self.BAUDRATES.index(baud_rate)
-        except ValueError:
-            print(f"Warning: Baud rate {baud_rate} not in list, using default 57142")
-            return self.BAUDRATES.index(57142)
+        index = self.BAUD_TO_INDEX.get(baud_rate)
+        if index is None:
+            logger.warning("Baud rate %d not in list, using default 57142", baud_rate)
+            index = self.BAUD_TO_INDEX[57142]
+        return index
     
     def _create_dynamixel_sync_write_packet(
         self, 
@@ -108,7 +159,7 @@ class RobotServoController:
         motor_data: List[bytes],
         start_address: int = GOAL_POSITION_ADDR,
         data_length: int = 4
-    ) -> bytes:
+    ) -> bytearray:
         """
         Create Dynamixel SYNC WRITE packet
         
@@ -124,30 +175,21 @@ class RobotServoController:
         num_motors = len(motor_ids)
         packet_length = (data_length + 1) * num_motors + 4
         
-        # Initialize packet
-        packet = bytearray()
-        
         # Header: 0xFF 0xFF 0xFE (broadcast), length, instruction (0x83 = SYNC WRITE)
-        packet.extend([0xFF, 0xFF, 0xFE, packet_length, 0x83, start_address, data_length])
-        
-        # Calculate CRC
-        crc = 0xFE + packet_length + 0x83 + start_address + data_length
+        packet = bytearray((0xFF, 0xFF, 0xFE, packet_length, 0x83, start_address, data_length))
         
         # Add motor data
-        for i, motor_id in enumerate(motor_ids):
+        for motor_id, data in zip(motor_ids, motor_data):
             packet.append(motor_id)
-            crc += motor_id
-            packet.extend(motor_data[i])
-            for byte in motor_data[i]:
-                crc += byte
+            packet += data
         
-        # Add CRC checksum
-        crc = (255 - (crc & 0xFF)) & 0xFF
-        packet.append(crc)
+        # Checksum covers ID..last param; sum() over a memoryview slice runs in C without copying
+        packet.append(~sum(memoryview(packet)[2:]) & 0xFF)
         
-        return bytes(packet)
+        # Returned as-is; the LUCI wrappers copy it into their own packet anyway
+        return packet
     
-    def _create_luci_uart_packet(self, baud_rate: int, uart_packet: bytes) -> bytes:
+    def _create_luci_uart_packet(self, baud_rate: int, uart_packet: bytes) -> bytearray:
         """
         Wrap Dynamixel packet in LUCI UART packet
         
@@ -161,7 +203,7 @@ class RobotServoController:
         baud_index = self._get_baud_rate_index(baud_rate)
         packet = bytearray([0, baud_index])
         packet.extend(uart_packet)
-        return bytes(packet)
+        return packet
     
     def _create_luci_packet(self, module_number: int, mode: int, packet0: bytes) -> bytes:
         """
@@ -178,26 +220,13 @@ class RobotServoController:
         if mode == 4 or mode == 5:
             return bytes([0, 0, 2])
         
-        # Convert lengths and module number to little-endian bytes
-        packet0_len_bytes = self._get_little_endian_bytes(len(packet0))
-        packet1_len_bytes = self._get_little_endian_bytes(0)
-        module_bytes = self._get_little_endian_bytes(module_number)
-        
         luci_length = len(packet0) + 5
-        luci_length_bytes = self._get_little_endian_bytes(luci_length)
-        
-        # Build packet
-        packet = bytearray()
-        packet.extend([0, 0, 2])  # LUCI header
-        packet.extend(module_bytes)  # Module number
-        packet.extend([0, 0, 0])  # Padding
-        packet.extend(luci_length_bytes)  # Length
-        packet.append(mode)  # Mode
-        packet.extend(packet0_len_bytes)  # Packet0 length
-        packet.extend(packet1_len_bytes)  # Packet1 length
-        packet.extend(packet0)  # UART packet data
         
-        return bytes(packet)
+        # Header fields packed in one call, followed by the UART packet data
+        header = self.LUCI_HEADER.pack(
+            2, module_number & 0xFFFF, luci_length & 0xFFFF, mode, len(packet0) & 0xFFFF, 0
+        )
+        return header + packet0
     
     def _degrees_to_motor_value(
         self, 
@@ -216,20 +245,72 @@ class RobotServoController:
         Returns:
             Motor value (0-1023 for AX, 0-4095 for MX position)
         """
-        if motor_type in [self.MOTORTYPE_AX12, self.MOTORTYPE_AX18]:
-            if is_position:
-                # AX: 0-300° maps to 0-1023
-                return int((degrees / 300.0) * 1023.0)
-            else:
-                # AX: 0-114 RPM maps to 0-1023
-                return int((degrees / 114.0) * 1023.0)
-        else:  # MX motors
-            if is_position:
-                # MX: 0-360° maps to 0-4095
-                return int((degrees / 360.0) * 4095.0)
-            else:
-                # MX: 0-117 RPM maps to 0-1023
-                return int((degrees / 117.0) * 1023.0)
+        # AX types use AX_SCALE, everything else the MX ranges
+        pos_range, pos_max, vel_range, vel_max = self.MOTOR_SCALES.get(motor_type, self.MX_SCALE)
+        if is_position:
+            return int((degrees / pos_range) * pos_max)
+        return int((degrees / vel_range) * vel_max)
+    
+    def _cached_packet(self, key: Tuple) -> bytes:
+        """Return the packet for key from this controller's cache, building it on a miss"""
+        packet = self.packet_cache.get(key)
+        if packet is None:
+            if len(self.packet_cache) >= self.PACKET_CACHE_SIZE:
+                self.packet_cache.clear()
+            packet = self.packet_cache[key] = self._build_packet(key)
+        return packet
+    
+    def _build_packet(self, key: Tuple) -> bytes:
+        """
+        Build the complete LUCI packet for a position command
+        
+        Args:
+            key: (motor_ids, motor_types, positions_degrees, velocities_rpm, baud_rate) as tuples
+        
+        Returns:
+            Complete LUCI packet bytes
+        """
+        motor_ids, motor_types, positions_degrees, velocities_rpm, baud_rate = key
+        
+        # Sizes are known up front, so the LUCI header, UART prefix and SYNC WRITE
+        # packet are written into one buffer instead of three nested bytearrays
+        num_motors = len(motor_ids)
+        dynamixel_length = (4 + 1) * num_motors + 4
+        uart_length = 2 + 4 + dynamixel_length
+        header_size = self.LUCI_HEADER.size
+        packet = bytearray(header_size + uart_length)
+        
+        # LUCI header (module 254, mode 0 = write)
+        self.LUCI_HEADER.pack_into(packet, 0, 2, 254, uart_length + 5, 0, uart_length, 0)
+        
+        # LUCI UART prefix, then SYNC WRITE header: 0xFF 0xFF 0xFE (broadcast), length, 0x83
+        packet[header_size:header_size + 9] = bytes((
+            0, self._get_baud_rate_index(baud_rate),
+            0xFF, 0xFF, 0xFE, dynamixel_length, 0x83, self.GOAL_POSITION_ADDR, 4
+        ))
+        
+        # Convert the whole batch of degrees to motor values in one pass
+        pack_into = self.POS_VEL_LE.pack_into
+        scales = self.MOTOR_SCALES
+        mx_scale = self.MX_SCALE
+        offset = header_size + 9
+        for motor_id, degrees, rpm, motor_type in zip(
+            motor_ids, positions_degrees, velocities_rpm, motor_types
+        ):
+            pos_range, pos_max, vel_range, vel_max = scales.get(motor_type, mx_scale)
+            packet[offset] = motor_id
+            # Little-endian [pos_low, pos_high, vel_low, vel_high]
+            pack_into(
+                packet, offset + 1,
+                int((degrees / pos_range) * pos_max) & 0xFFFF,
+                int((rpm / vel_range) * vel_max) & 0xFFFF
+            )
+            offset += 5
+        
+        # Checksum covers ID..last param (everything after 0xFF 0xFF)
+        packet[offset] = ~sum(memoryview(packet)[header_size + 4:offset]) & 0xFF
+        
+        return bytes(packet)
     
     def send_servo_positions(
         self,
@@ -237,7 +318,8 @@ class RobotServoController:
         motor_types: List[int],
         positions_degrees: List[float],
         velocities_rpm: List[float],
-        baud_rate: int = 57142
+        baud_rate: int = 57142,
+        debug: bool = False
     ) -> bool:
         """
         Send position and velocity commands to multiple servos
@@ -248,51 +330,173 @@ class RobotServoController:
             positions_degrees: List of target positions in degrees
             velocities_rpm: List of velocities in RPM
             baud_rate: Serial baud rate (default 57142)
+            debug: Log packet details at DEBUG level (see send_servo_positions_debug)
         
         Returns:
             True if sent successfully, False otherwise
         """
+        if debug:
+            return self.send_servo_positions_debug(
+                motor_ids, motor_types, positions_degrees, velocities_rpm, baud_rate
+            )
+        
         if not self.connected:
-            print("Error: Not connected to robot")
+            logger.error("Not connected to robot")
             return False
         
-        if len(motor_ids) != len(motor_types) != len(positions_degrees) != len(velocities_rpm):
-            print("Error: All lists must have the same length")
+        num_motors = len(motor_ids)
+        if not (len(motor_types) == num_motors == len(positions_degrees) == len(velocities_rpm)):
+            logger.error("All lists must have the same length")
             return False
         
-        # Convert degrees to motor values
-        motor_data = []
-        for i in range(len(motor_ids)):
-            goal_pos = self._degrees_to_motor_value(positions_degrees[i], motor_types[i], True)
-            goal_vel = self._degrees_to_motor_value(velocities_rpm[i], motor_types[i], False)
-            
-            # Convert to little-endian bytes
-            pos_bytes = self._get_little_endian_bytes(goal_pos)
-            vel_bytes = self._get_little_endian_bytes(goal_vel)
-            
-            # Combine: [pos_low, pos_high, vel_low, vel_high]
-            motor_data.append(pos_bytes + vel_bytes)
-        
-        # Create Dynamixel SYNC WRITE packet
-        dynamixel_packet = self._create_dynamixel_sync_write_packet(
-            motor_ids, motor_data, self.GOAL_POSITION_ADDR, 4
-        )
-        
-        # Wrap in LUCI UART packet
-        luci_uart_packet = self._create_luci_uart_packet(baud_rate, dynamixel_packet)
-        
-        # Create final LUCI packet (module 254, mode 0 = write)
-        luci_packet = self._create_luci_packet(254, 0, luci_uart_packet)
+        # Repeated poses (neutral, animation frames) reuse the already built packet
+        luci_packet = self._cached_packet((
+            tuple(motor_ids), tuple(motor_types), tuple(positions_degrees),
+            tuple(velocities_rpm), baud_rate
+        ))
         
         # Send packet
         try:
-            bytes_sent = self.socket.send(luci_packet)
-            time.sleep(0.035)  # Delay matching Android app (35ms)
+            self._wait_send_slot()
+            self.socket.sendall(luci_packet)
             return True
-        except Exception as e:
-            print(f"Error sending packet: {e}")
+        except OSError as e:
+            logger.error("Error sending packet: %s", e)
             return False
     
+    def send_servo_positions_many(self, frames: List[dict], frame_interval_s: float = 0.0) -> int:
+        """
+        Send a sequence of position commands (e.g. animation frames)
+        
+        Args:
+            frames: List of dicts with motor_ids, motor_types, positions_degrees,
+                    velocities_rpm and optional baud_rate (as for send_servo_positions)
+            frame_interval_s: Delay between frames; 0 sends every frame in one socket write
+        
+        Returns:
+            Number of frames sent
+        """
+        if not self.connected:
+            logger.error("Not connected to robot")
+            return 0
+        
+        packets = []
+        for frame in frames:
+            motor_ids = frame['motor_ids']
+            motor_types = frame['motor_types']
+            positions_degrees = frame['positions_degrees']
+            velocities_rpm = frame['velocities_rpm']
+            num_motors = len(motor_ids)
+            if not (len(motor_types) == num_motors == len(positions_degrees) == len(velocities_rpm)):
+                logger.error("All lists must have the same length")
+                return 0
+            packets.append(self._cached_packet((
+                tuple(motor_ids), tuple(motor_types), tuple(positions_degrees),
+                tuple(velocities_rpm), frame.get('baud_rate', 57142)
+            )))
+        
+        return self.send_packets(packets, frame_interval_s)
+    
+    def send_packets(self, packets: List[bytes], frame_interval_s: float = 0.0) -> int:
+        """
+        Send prebuilt LUCI packets (from _cached_packet or position_packets)
+        
+        Args:
+            packets: Complete LUCI packets, one per frame
+            frame_interval_s: Delay between frames; 0 sends every frame in one socket write
+        
+        Returns:
+            Number of packets sent
+        """
+        if not self.connected:
+            logger.error("Not connected to robot")
+            return 0
+        
+        sent = 0
+        try:
+            if frame_interval_s <= 0:
+                # One syscall; the kernel packs the frames into as few segments as it can
+                self._wait_send_slot()
+                self.socket.sendall(b''.join(packets))
+                return len(packets)
+            
+            # Pace frames from a fixed deadline so the interval does not drift
+            next_frame = time.perf_counter()
+            for luci_packet in packets:
+                delay = next_frame - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                self.socket.sendall(luci_packet)
+                sent += 1
+                next_frame += frame_interval_s
+            self.last_send_time = time.monotonic()
+            return sent
+        except OSError as e:
+            logger.error("Error sending packet: %s", e)
+            return sent
+    
+    def build_position_template(
+        self,
+        motor_ids: List[int],
+        motor_types: List[int],
+        velocities_rpm: List[float],
+        baud_rate: int = 57142
+    ) -> Tuple[bytearray, List[int], int, int]:
+        """
+        Build a position packet whose goal positions are all zero, for frames that
+        only change positions
+        
+        Returns:
+            (template, pos_offsets, crc_offset, base_crc) where pos_offsets[i] is where
+            motor i's 2-byte goal position goes and base_crc is the checksum sum without them
+        """
+        template = bytearray(self._build_packet((
+            tuple(motor_ids), tuple(motor_types), (0,) * len(motor_ids),
+            tuple(velocities_rpm), baud_rate
+        )))
+        # Each motor block is ID, pos (2), vel (2) after the LUCI header, UART prefix and
+        # the 7-byte SYNC WRITE header
+        first = self.LUCI_HEADER.size + 9 + 1
+        pos_offsets = list(range(first, first + 5 * len(motor_ids), 5))
+        crc_offset = len(template) - 1
+        base_crc = sum(memoryview(template)[self.LUCI_HEADER.size + 4:crc_offset])
+        return template, pos_offsets, crc_offset, base_crc
+    
+    def position_packets(
+        self,
+        motor_ids: List[int],
+        motor_types: List[int],
+        poses_degrees: List[List[float]],
+        velocities_rpm: List[float],
+        baud_rate: int = 57142
+    ) -> List[bytes]:
+        """
+        Build one LUCI packet per pose from a shared template; only the position bytes
+        and checksum are written per frame
+        
+        Returns:
+            List of complete LUCI packets, ready for send_packets
+        """
+        template, pos_offsets, crc_offset, base_crc = self.build_position_template(
+            motor_ids, motor_types, velocities_rpm, baud_rate
+        )
+        scales = self.MOTOR_SCALES
+        mx_scale = self.MX_SCALE
+        pos_scales = [scales.get(motor_type, mx_scale)[:2] for motor_type in motor_types]
+        pack_into = self.U16_LE.pack_into
+        
+        packets = []
+        for pose in poses_degrees:
+            packet = template[:]
+            crc = base_crc
+            for offset, degrees, (pos_range, pos_max) in zip(pos_offsets, pose, pos_scales):
+                value = int((degrees / pos_range) * pos_max) & 0xFFFF
+                pack_into(packet, offset, value)
+                crc += (value & 0xFF) + (value >> 8)
+            packet[crc_offset] = ~crc & 0xFF
+            packets.append(bytes(packet))
+        return packets
+    
     def send_servo_positions_debug(
         self,
         motor_ids: List[int],
@@ -302,20 +506,23 @@ class RobotServoController:
         baud_rate: int = 57142
     ) -> bool:
         """
-        Debug version that prints packet information
+        Debug version that logs packet information at DEBUG level.
         """
         if not self.connected:
-            print("Error: Not connected to robot")
+            logger.error("Not connected to robot")
             return False
         
-        if len(motor_ids) != len(motor_types) != len(positions_degrees) != len(velocities_rpm):
-            print("Error: All lists must have the same length")
+        num_motors = len(motor_ids)
+        if not (len(motor_types) == num_motors == len(positions_degrees) == len(velocities_rpm)):
+            logger.error("All lists must have the same length")
             return False
         
-        print(f"\n[DEBUG] Sending to {len(motor_ids)} motors:")
-        print(f"  Motor IDs: {motor_ids}")
-        print(f"  Positions (degrees): {positions_degrees}")
-        print(f"  Velocities (RPM): {velocities_rpm}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Sending to %d motors:", len(motor_ids))
+            logger.debug("  Motor IDs: %s", list(motor_ids))
+            logger.debug("  Positions (degrees): %s", positions_degrees)
+            logger.debug("  Velocities (RPM): %s", velocities_rpm)
         
         # Convert degrees to motor values
         motor_data = []
@@ -323,39 +530,40 @@ class RobotServoController:
             goal_pos = self._degrees_to_motor_value(positions_degrees[i], motor_types[i], True)
             goal_vel = self._degrees_to_motor_value(velocities_rpm[i], motor_types[i], False)
             
-            print(f"  Motor {motor_ids[i]}: {positions_degrees[i]}° -> {goal_pos}, {velocities_rpm[i]} RPM -> {goal_vel}")
-            
-            # Convert to little-endian bytes
-            pos_bytes = self._get_little_endian_bytes(goal_pos)
-            vel_bytes = self._get_little_endian_bytes(goal_vel)
+            if debug:
+                logger.debug("  Motor %d: %s° -> %d, %s RPM -> %d",
+                             motor_ids[i], positions_degrees[i], goal_pos, velocities_rpm[i], goal_vel)
             
-            # Combine: [pos_low, pos_high, vel_low, vel_high]
-            motor_data.append(pos_bytes + vel_bytes)
+            # Little-endian [pos_low, pos_high, vel_low, vel_high]
+            motor_data.append(self.POS_VEL_LE.pack(goal_pos & 0xFFFF, goal_vel & 0xFFFF))
         
         # Create Dynamixel SYNC WRITE packet
         dynamixel_packet = self._create_dynamixel_sync_write_packet(
             motor_ids, motor_data, self.GOAL_POSITION_ADDR, 4
         )
-        print(f"  Dynamixel packet length: {len(dynamixel_packet)} bytes")
-        print(f"  Dynamixel packet (hex): {dynamixel_packet.hex()}")
+        if debug:
+            logger.debug("  Dynamixel packet length: %d bytes", len(dynamixel_packet))
+            logger.debug("  Dynamixel packet (hex): %s", dynamixel_packet.hex())
         
         # Wrap in LUCI UART packet
         luci_uart_packet = self._create_luci_uart_packet(baud_rate, dynamixel_packet)
-        print(f"  LUCI UART packet length: {len(luci_uart_packet)} bytes")
+        if debug:
+            logger.debug("  LUCI UART packet length: %d bytes", len(luci_uart_packet))
         
         # Create final LUCI packet (module 254, mode 0 = write)
         luci_packet = self._create_luci_packet(254, 0, luci_uart_packet)
-        print(f"  Final LUCI packet length: {len(luci_packet)} bytes")
-        print(f"  Final LUCI packet (hex): {luci_packet.hex()[:100]}...")  # First 100 chars
+        if debug:
+            logger.debug("  Final LUCI packet length: %d bytes", len(luci_packet))
+            logger.debug("  Final LUCI packet (hex): %s...", luci_packet.hex()[:100])  # First 100 chars
         
         # Send packet
         try:
-            bytes_sent = self.socket.send(luci_packet)
-            print(f"  ✓ Sent {bytes_sent} bytes")
-            time.sleep(0.035)  # Delay matching Android app
+            self._wait_send_slot()
+            self.socket.sendall(luci_packet)
+            logger.debug("  ✓ Sent %d bytes", len(luci_packet))
             return True
-        except Exception as e:
-            print(f"  ✗ Error sending packet: {e}")
+        except OSError as e:
+            logger.error("  ✗ Error sending packet: %s", e)
             return False
     
     def send_all_servos(
@@ -447,10 +655,13 @@ if __name__ == "__main__":
         
         # Example 4: Animated movement
         print("4. Performing animated movement...")
-        for angle in range(90, 210, 10):
-            positions = [angle] * 12
-            controller.send_all_servos(positions)
-            time.sleep(0.1)
+        packets = controller.position_packets(
+            list(range(1, 13)),
+            [controller.MOTORTYPE_AX12] * 12,
+            [[angle] * 12 for angle in range(90, 210, 10)],
+            [30.0] * 12
+        )
+        controller.send_packets(packets, frame_interval_s=0.1)
         
         # Return to neutral
         print("5. Returning to neutral...")
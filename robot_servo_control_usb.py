@@ -5,10 +5,53 @@ Controls Dynamixel servos (AX-12, AX-18, MX-28, MX-64, MX-106) through LUCI prot
 Uses serial communication instead of TCP/IP
 """
 
+import functools
+import logging
+import os
+import queue
 import serial
 import struct
+import threading
 import time
-from typing import List, Optional
+from typing import Callable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=32)
+def motor_block_struct(num_motors: int) -> struct.Struct:
+    """Struct packing ID, goal position and moving speed for each of num_motors motors"""
+    return struct.Struct('<' + 'BHH' * num_motors)
+
+
+def enable_low_latency(ser: serial.Serial) -> bool:
+    """
+    Drop the USB-serial latency timer (16ms -> 1ms on FTDI) where supported.
+    Never raises: pyserial only has set_low_latency_mode on POSIX (not on Windows),
+    and a port that cannot be tuned still works, just with more latency.
+    
+    Returns:
+        True if low-latency mode was enabled
+    """
+    set_low_latency_mode = getattr(ser, "set_low_latency_mode", None)
+    if set_low_latency_mode is not None:
+        try:
+            set_low_latency_mode(True)
+            logger.debug("Low-latency mode enabled on %s", ser.port)
+            return True
+        except (OSError, ValueError, NotImplementedError):
+            pass
+    
+    # Linux fallback for drivers without ASYNC_LOW_LATENCY: set the FTDI timer via sysfs
+    latency_path = f"/sys/bus/usb-serial/devices/{os.path.basename(ser.port)}/latency_timer"
+    try:
+        with open(latency_path, "w") as f:
+            f.write("1")
+        logger.debug("Set %s to 1 ms", latency_path)
+        return True
+    except OSError:
+        logger.debug("Low-latency mode not available on %s", ser.port)
+        return False
 
 
 class RobotServoControllerUSB:
@@ -24,10 +67,25 @@ class RobotServoControllerUSB:
     
     # Baud rates (matching Java code)
     BAUDRATES = [2000000, 1000000, 500000, 222222, 117647, 100000, 57142, 9615]
+    BAUD_TO_INDEX = {baud: index for index, baud in enumerate(BAUDRATES)}
+    
+    # Degrees/RPM -> motor value as (pos_range, pos_max, vel_range, vel_max);
+    # AX: 0-300° -> 0-1023, 0-114 RPM -> 0-1023. MX: 0-360° -> 0-4095, 0-117 RPM -> 0-1023
+    AX_SCALE = (300.0, 1023.0, 114.0, 1023.0)
+    MX_SCALE = (360.0, 4095.0, 117.0, 1023.0)
+    MOTOR_SCALES = {MOTORTYPE_AX12: AX_SCALE, MOTORTYPE_AX18: AX_SCALE}
     
     # Dynamixel register addresses
     GOAL_POSITION_ADDR = 30  # Start address for goal position
     
+    # Precompiled packer (skips format-string parsing on every call)
+    U16_LE = struct.Struct('<H')
+    # SYNC WRITE header: 0xFF 0xFF 0xFE (broadcast), length, 0x83, start address, data length
+    SYNC_WRITE_HEADER = struct.Struct('<7B')
+    
+    # Motor types for all 12 servos as one immutable bytes object (reused, never rebuilt)
+    AX12_TYPES_12 = bytes([MOTORTYPE_AX12]) * 12
+    
     def __init__(self, port: str, baud_rate: int = 57600):
         """
         Initialize robot controller
@@ -40,6 +98,14 @@ class RobotServoControllerUSB:
         self.baud_rate = baud_rate
         self.ser: Optional[serial.Serial] = None
         self.connected = False
+        # Preassembled LUCI headers keyed by (module_number, mode); only the lengths vary per packet
+        self.luci_prefixes = {}
+        # Earliest time the previous packet has fully left the UART
+        self.next_send_time = 0.0
+        # Specialized sender for the default send_all_servos call (IDs 1-12, AX12, 30 RPM, 57142)
+        self.send_default_12 = self._make_specialized_sender(
+            list(range(1, 13)), self.AX12_TYPES_12, [30.0] * 12, 57142
+        )
         
     def connect(self, debug: bool = False) -> bool:
         """Connect to robot controller via USB/Serial"""
@@ -56,11 +122,13 @@ class RobotServoControllerUSB:
                 stopbits=serial.STOPBITS_ONE
             )
             
-            # Flush any existing data
-            self.ser.flushInput()
-            self.ser.flushOutput()
+            enable_low_latency(self.ser)
             
-            time.sleep(0.5)  # Give serial port time to initialize
+            # Short settle for the port (was a blind 500 ms), then drop anything
+            # stale that arrived while opening
+            self.ser.reset_output_buffer()
+            time.sleep(0.05)
+            self.ser.reset_input_buffer()
             
             self.connected = True
             if debug:
@@ -77,70 +145,76 @@ class RobotServoControllerUSB:
         """Disconnect from robot controller"""
         if self.ser and self.ser.is_open:
             try:
+                self.ser.flush()  # Let queued commands reach the robot before closing
                 self.ser.close()
             except:
                 pass
         self.connected = False
         print("Disconnected from robot")
     
+    def wait_tx_empty(self):
+        """Block until every queued byte has been transmitted (sends no longer wait for this)"""
+        if self.ser and self.ser.is_open:
+            self.ser.flush()
+    
+    def _wait_send_slot(self, packet_size: int):
+        """
+        Wait until the previous packet has had time to go out on the wire, then
+        reserve the link for this one (10 bits per byte: start + 8 data + stop)
+        """
+        delay = self.next_send_time - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self.next_send_time = time.monotonic() + packet_size * 10 / self.baud_rate
+    
     def _get_little_endian_bytes(self, value: int) -> bytes:
         """Convert integer to little-endian 2-byte array"""
-        return struct.pack('<H', value & 0xFFFF)
+        return self.U16_LE.pack(value & 0xFFFF)
     
     def _get_baud_rate_index(self, baud_rate: int) -> int:
         """Get baud rate index from baud rate value"""
-        try:
-            return self.BAUDRATES.index(baud_rate)
-        except ValueError:
+        index = self.BAUD_TO_INDEX.get(baud_rate)
+        if index is None:
             print(f"Warning: Baud rate {baud_rate} not in list, using default 57142")
-            return self.BAUDRATES.index(57142)
+            index = self.BAUD_TO_INDEX[57142]
+        return index
     
     def _create_dynamixel_sync_write_packet(
         self, 
-        motor_ids: List[int], 
-        motor_data: List[bytes],
+        motor_params: bytes,
+        num_motors: int,
         start_address: int = GOAL_POSITION_ADDR,
         data_length: int = 4
-    ) -> bytes:
+    ) -> bytearray:
         """
         Create Dynamixel SYNC WRITE packet
         
         Args:
-            motor_ids: List of motor IDs
-            motor_data: List of data bytes for each motor (4 bytes: 2 pos + 2 vel)
+            motor_params: Packed [ID, data...] blocks for all motors (see motor_block_struct)
+            num_motors: Number of motors in motor_params
             start_address: Register start address (default 30 for goal position)
             data_length: Length of data per motor (default 4 bytes)
         
         Returns:
             Dynamixel SYNC WRITE packet bytes
         """
-        num_motors = len(motor_ids)
         packet_length = (data_length + 1) * num_motors + 4
+        header_size = self.SYNC_WRITE_HEADER.size
+        end = header_size + len(motor_params)
         
-        # Initialize packet
-        packet = bytearray()
-        
-        # Header: 0xFF 0xFF 0xFE (broadcast), length, instruction (0x83 = SYNC WRITE)
-        packet.extend([0xFF, 0xFF, 0xFE, packet_length, 0x83, start_address, data_length])
-        
-        # Calculate CRC
-        crc = 0xFE + packet_length + 0x83 + start_address + data_length
-        
-        # Add motor data
-        for i, motor_id in enumerate(motor_ids):
-            packet.append(motor_id)
-            crc += motor_id
-            packet.extend(motor_data[i])
-            for byte in motor_data[i]:
-                crc += byte
+        # Exact size is known: header + motor blocks + checksum, written in place
+        packet = bytearray(end + 1)
+        self.SYNC_WRITE_HEADER.pack_into(
+            packet, 0, 0xFF, 0xFF, 0xFE, packet_length, 0x83, start_address, data_length
+        )
+        packet[header_size:end] = motor_params
         
-        # Add CRC checksum
-        crc = (255 - (crc & 0xFF)) & 0xFF
-        packet.append(crc)
+        # Checksum covers ID..last param; sum() over a memoryview slice runs in C without copying
+        packet[end] = ~sum(memoryview(packet)[2:end]) & 0xFF
         
-        return bytes(packet)
+        return packet
     
-    def _create_luci_uart_packet(self, baud_rate: int, uart_packet: bytes) -> bytes:
+    def _create_luci_uart_packet(self, baud_rate: int, uart_packet: bytes) -> bytearray:
         """
         Wrap Dynamixel packet in LUCI UART packet
         
@@ -152,11 +226,25 @@ class RobotServoControllerUSB:
             LUCI UART packet bytes
         """
         baud_index = self._get_baud_rate_index(baud_rate)
-        packet = bytearray([0, baud_index])
-        packet.extend(uart_packet)
-        return bytes(packet)
+        packet = bytearray(2 + len(uart_packet))
+        packet[1] = baud_index
+        packet[2:] = uart_packet
+        return packet
+    
+    def _luci_prefix(self, module_number: int, mode: int) -> bytes:
+        """Cached LUCI header for (module_number, mode) with both length fields left at zero"""
+        prefix = self.luci_prefixes.get((module_number, mode))
+        if prefix is None:
+            # LUCI header, module number, padding, length (patched per packet), mode,
+            # packet0 length (patched per packet), packet1 length (always 0)
+            prefix = (
+                bytes([0, 0, 2]) + self._get_little_endian_bytes(module_number) + bytes(3)
+                + bytes(2) + bytes([mode]) + bytes(2) + bytes(2)
+            )
+            self.luci_prefixes[(module_number, mode)] = prefix
+        return prefix
     
-    def _create_luci_packet(self, module_number: int, mode: int, packet0: bytes) -> bytes:
+    def _create_luci_packet(self, module_number: int, mode: int, packet0: bytes) -> bytearray:
         """
         Create final LUCI protocol packet
         
@@ -169,28 +257,18 @@ class RobotServoControllerUSB:
             Complete LUCI packet bytes
         """
         if mode == 4 or mode == 5:
-            return bytes([0, 0, 2])
-        
-        # Convert lengths and module number to little-endian bytes
-        packet0_len_bytes = self._get_little_endian_bytes(len(packet0))
-        packet1_len_bytes = self._get_little_endian_bytes(0)
-        module_bytes = self._get_little_endian_bytes(module_number)
-        
-        luci_length = len(packet0) + 5
-        luci_length_bytes = self._get_little_endian_bytes(luci_length)
-        
-        # Build packet
-        packet = bytearray()
-        packet.extend([0, 0, 2])  # LUCI header
-        packet.extend(module_bytes)  # Module number
-        packet.extend([0, 0, 0])  # Padding
-        packet.extend(luci_length_bytes)  # Length
-        packet.append(mode)  # Mode
-        packet.extend(packet0_len_bytes)  # Packet0 length
-        packet.extend(packet1_len_bytes)  # Packet1 length
-        packet.extend(packet0)  # UART packet data
-        
-        return bytes(packet)
+            return bytearray([0, 0, 2])
+        
+        prefix = self._luci_prefix(module_number, mode)
+        header_size = len(prefix)
+        packet = bytearray(header_size + len(packet0))
+        packet[:header_size] = prefix
+        self.U16_LE.pack_into(packet, 8, (len(packet0) + 5) & 0xFFFF)  # Length
+        self.U16_LE.pack_into(packet, 11, len(packet0) & 0xFFFF)  # Packet0 length
+        packet[header_size:] = packet0  # UART packet data
+        
+        # Handed to ser.write as-is; pyserial accepts any buffer
+        return packet
     
     def _degrees_to_motor_value(
         self, 
@@ -209,25 +287,37 @@ class RobotServoControllerUSB:
         Returns:
             Motor value (0-1023 for AX, 0-4095 for MX position)
         """
-        if motor_type in [self.MOTORTYPE_AX12, self.MOTORTYPE_AX18]:
-            if is_position:
-                # AX: 0-300° maps to 0-1023
-                return int((degrees / 300.0) * 1023.0)
-            else:
-                # AX: 0-114 RPM maps to 0-1023
-                return int((degrees / 114.0) * 1023.0)
-        else:  # MX motors
-            if is_position:
-                # MX: 0-360° maps to 0-4095
-                return int((degrees / 360.0) * 4095.0)
-            else:
-                # MX: 0-117 RPM maps to 0-1023
-                return int((degrees / 117.0) * 1023.0)
+        # AX types use AX_SCALE, everything else the MX ranges
+        pos_range, pos_max, vel_range, vel_max = self.MOTOR_SCALES.get(motor_type, self.MX_SCALE)
+        if is_position:
+            return int((degrees / pos_range) * pos_max)
+        return int((degrees / vel_range) * vel_max)
+    
+    def _degrees_to_motor_values(
+        self,
+        values: Sequence[float],
+        motor_types: Sequence[int],
+        is_position: bool = True
+    ) -> List[int]:
+        """
+        Batch form of _degrees_to_motor_value for a whole pose
+        
+        Returns:
+            16-bit register values, one per motor
+        """
+        scales = self.MOTOR_SCALES
+        mx_scale = self.MX_SCALE
+        field = 0 if is_position else 2
+        ranges = [scales.get(motor_type, mx_scale)[field:field + 2] for motor_type in motor_types]
+        return [
+            int((value / value_range) * value_max) & 0xFFFF
+            for value, (value_range, value_max) in zip(values, ranges)
+        ]
     
     def send_servo_positions(
         self,
         motor_ids: List[int],
-        motor_types: List[int],
+        motor_types: Sequence[int],
         positions_degrees: List[float],
         velocities_rpm: List[float],
         baud_rate: int = 57142
@@ -237,7 +327,7 @@ class RobotServoControllerUSB:
         
         Args:
             motor_ids: List of motor IDs (e.g., [1, 2, 3, ...])
-            motor_types: List of motor types (MOTORTYPE_AX12, etc.)
+            motor_types: Motor types (MOTORTYPE_AX12, etc.); a list or a bytes object
             positions_degrees: List of target positions in degrees
             velocities_rpm: List of velocities in RPM
             baud_rate: Serial baud rate (default 57142)
@@ -249,108 +339,252 @@ class RobotServoControllerUSB:
             print("Error: Not connected to robot")
             return False
         
-        if len(motor_ids) != len(motor_types) != len(positions_degrees) != len(velocities_rpm):
+        num_motors = len(motor_ids)
+        if not (len(motor_types) == num_motors == len(positions_degrees) == len(velocities_rpm)):
             print("Error: All lists must have the same length")
             return False
         
-        # Convert degrees to motor values
-        motor_data = []
-        for i in range(len(motor_ids)):
-            goal_pos = self._degrees_to_motor_value(positions_degrees[i], motor_types[i], True)
-            goal_vel = self._degrees_to_motor_value(velocities_rpm[i], motor_types[i], False)
-            
-            # Convert to little-endian bytes
-            pos_bytes = self._get_little_endian_bytes(goal_pos)
-            vel_bytes = self._get_little_endian_bytes(goal_vel)
-            
-            # Combine: [pos_low, pos_high, vel_low, vel_high]
-            motor_data.append(pos_bytes + vel_bytes)
+        # Convert the whole pose to motor values, then interleave as ID, pos, vel per motor
+        goal_positions = self._degrees_to_motor_values(positions_degrees, motor_types, True)
+        goal_speeds = self._degrees_to_motor_values(velocities_rpm, motor_types, False)
+        values = [value for block in zip(motor_ids, goal_positions, goal_speeds) for value in block]
         
-        # Create Dynamixel SYNC WRITE packet
+        # All [ID, pos_low, pos_high, vel_low, vel_high] blocks in one pack call
+        motor_params = motor_block_struct(num_motors).pack(*values)
+        
+        # Create Dynamixel SYNC WRITE packet, wrap it for the UART and in the LUCI header
+        # (module 254, mode 0 = write)
         dynamixel_packet = self._create_dynamixel_sync_write_packet(
-            motor_ids, motor_data, self.GOAL_POSITION_ADDR, 4
+            motor_params, num_motors, self.GOAL_POSITION_ADDR, 4
         )
-        
-        # Wrap in LUCI UART packet
         luci_uart_packet = self._create_luci_uart_packet(baud_rate, dynamixel_packet)
-        
-        # Create final LUCI packet (module 254, mode 0 = write)
         luci_packet = self._create_luci_packet(254, 0, luci_uart_packet)
         
         # Send packet via serial
         try:
+            self._wait_send_slot(len(luci_packet))
             self.ser.write(luci_packet)
-            self.ser.flush()  # Ensure data is sent
-            time.sleep(0.035)  # Delay matching Android app (35ms)
             return True
         except Exception as e:
             print(f"Error sending packet: {e}")
             return False
     
+    def prepare_sync_write_template(
+        self,
+        motor_ids: List[int],
+        motor_types: Sequence[int],
+        baud_rate: int = 57142
+    ) -> Tuple[bytearray, List[Tuple[int, int]], int, int, Sequence[int]]:
+        """
+        Build a reusable position/velocity packet for a fixed set of motors
+        
+        Args:
+            motor_ids: List of motor IDs
+            motor_types: Motor types (MOTORTYPE_AX12, etc.); a list or a bytes object
+            baud_rate: Serial baud rate (default 57142)
+        
+        Returns:
+            Template for send_prepared: (packet, [(pos_offset, vel_offset), ...], crc_offset,
+            base_crc, motor_types) where base_crc is the checksum sum with all fields at zero
+        """
+        num_motors = len(motor_ids)
+        motor_params = motor_block_struct(num_motors).pack(
+            *[value for motor_id in motor_ids for value in (motor_id, 0, 0)]
+        )
+        dynamixel_packet = self._create_dynamixel_sync_write_packet(
+            motor_params, num_motors, self.GOAL_POSITION_ADDR, 4
+        )
+        luci_uart_packet = self._create_luci_uart_packet(baud_rate, dynamixel_packet)
+        packet = self._create_luci_packet(254, 0, luci_uart_packet)
+        
+        # Motor blocks (ID, pos, vel) follow the LUCI header, UART prefix and 7-byte SYNC WRITE header
+        dynamixel_start = len(packet) - len(dynamixel_packet)
+        first = dynamixel_start + 7 + 1
+        offsets = [(offset, offset + 2) for offset in range(first, first + 5 * num_motors, 5)]
+        crc_offset = len(packet) - 1
+        base_crc = sum(memoryview(packet)[dynamixel_start + 2:crc_offset])
+        return packet, offsets, crc_offset, base_crc, motor_types
+    
+    def send_prepared(
+        self,
+        template: Tuple[bytearray, List[Tuple[int, int]], int, int, Sequence[int]],
+        positions_degrees: List[float],
+        velocities_rpm: List[float]
+    ) -> bool:
+        """
+        Send new positions/velocities using a template from prepare_sync_write_template.
+        Only the changed fields and the checksum are rewritten; the packet buffer is reused.
+        
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        if not self.connected:
+            print("Error: Not connected to robot")
+            return False
+        
+        packet, offsets, crc_offset, base_crc, motor_types = template
+        if not (len(positions_degrees) == len(offsets) == len(velocities_rpm)):
+            print("Error: All lists must have the same length")
+            return False
+        
+        goal_positions = self._degrees_to_motor_values(positions_degrees, motor_types, True)
+        goal_speeds = self._degrees_to_motor_values(velocities_rpm, motor_types, False)
+        crc = base_crc
+        for (pos_offset, vel_offset), goal_pos, goal_vel in zip(offsets, goal_positions, goal_speeds):
+            # Little-endian stores by index; cheaper than a Struct call for 2 bytes,
+            # and the split bytes feed the checksum directly
+            pos_low, pos_high = goal_pos & 0xFF, goal_pos >> 8
+            vel_low, vel_high = goal_vel & 0xFF, goal_vel >> 8
+            packet[pos_offset] = pos_low
+            packet[pos_offset + 1] = pos_high
+            packet[vel_offset] = vel_low
+            packet[vel_offset + 1] = vel_high
+            crc += pos_low + pos_high + vel_low + vel_high
+        packet[crc_offset] = ~crc & 0xFF
+        
+        # Send packet via serial
+        try:
+            self._wait_send_slot(len(packet))
+            self.ser.write(packet)
+            return True
+        except Exception as e:
+            print(f"Error sending packet: {e}")
+            return False
+    
+    def _make_specialized_sender(
+        self,
+        motor_ids: List[int],
+        motor_types: Sequence[int],
+        velocities_rpm: List[float],
+        baud_rate: int = 57142
+    ) -> Callable[[List[float]], bool]:
+        """
+        Build a sender for a fixed motor set whose speeds never change
+        
+        Everything but the goal positions (headers, IDs, speeds and their checksum
+        contribution) is computed once here; the returned function only converts and
+        stores the positions, finishes the checksum and writes the packet.
+        
+        Returns:
+            send(positions_degrees) -> bool
+        """
+        packet, offsets, crc_offset, base_crc, _ = self.prepare_sync_write_template(
+            motor_ids, motor_types, baud_rate
+        )
+        goal_speeds = self._degrees_to_motor_values(velocities_rpm, motor_types, False)
+        for (_, vel_offset), goal_vel in zip(offsets, goal_speeds):
+            self.U16_LE.pack_into(packet, vel_offset, goal_vel)
+            base_crc += (goal_vel & 0xFF) + (goal_vel >> 8)
+        
+        num_motors = len(motor_ids)
+        pos_offsets = [pos_offset for pos_offset, _ in offsets]
+        pos_scales = [
+            self.MOTOR_SCALES.get(motor_type, self.MX_SCALE)[:2] for motor_type in motor_types
+        ]
+        packet_size = len(packet)
+        
+        def send(positions_degrees: List[float]) -> bool:
+            if not self.connected:
+                print("Error: Not connected to robot")
+                return False
+            
+            if len(positions_degrees) != num_motors:
+                print("Error: All lists must have the same length")
+                return False
+            
+            crc = base_crc
+            for offset, degrees, (pos_range, pos_max) in zip(pos_offsets, positions_degrees, pos_scales):
+                goal_pos = int((degrees / pos_range) * pos_max) & 0xFFFF
+                pos_low, pos_high = goal_pos & 0xFF, goal_pos >> 8
+                packet[offset] = pos_low
+                packet[offset + 1] = pos_high
+                crc += pos_low + pos_high
+            packet[crc_offset] = ~crc & 0xFF
+            
+            # Send packet via serial
+            try:
+                self._wait_send_slot(packet_size)
+                self.ser.write(packet)
+                return True
+            except Exception as e:
+                print(f"Error sending packet: {e}")
+                return False
+        
+        return send
+    
     def send_servo_positions_debug(
         self,
         motor_ids: List[int],
-        motor_types: List[int],
+        motor_types: Sequence[int],
         positions_degrees: List[float],
         velocities_rpm: List[float],
         baud_rate: int = 57142
     ) -> bool:
         """
-        Debug version that prints packet information
+        Debug version that logs packet information at DEBUG level.
         """
         if not self.connected:
-            print("Error: Not connected to robot")
+            logger.error("Not connected to robot")
             return False
         
-        if len(motor_ids) != len(motor_types) != len(positions_degrees) != len(velocities_rpm):
-            print("Error: All lists must have the same length")
+        num_motors = len(motor_ids)
+        if not (len(motor_types) == num_motors == len(positions_degrees) == len(velocities_rpm)):
+            logger.error("All lists must have the same length")
             return False
         
-        print(f"\n[DEBUG] Sending to {len(motor_ids)} motors:")
-        print(f"  Motor IDs: {motor_ids}")
-        print(f"  Positions (degrees): {positions_degrees}")
-        print(f"  Velocities (RPM): {velocities_rpm}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Sending to %d motors:", num_motors)
+            logger.debug("  Motor IDs: %s", list(motor_ids))
+            logger.debug("  Positions (degrees): %s", positions_degrees)
+            logger.debug("  Velocities (RPM): %s", velocities_rpm)
         
         # Convert degrees to motor values
-        motor_data = []
-        for i in range(len(motor_ids)):
-            goal_pos = self._degrees_to_motor_value(positions_degrees[i], motor_types[i], True)
-            goal_vel = self._degrees_to_motor_value(velocities_rpm[i], motor_types[i], False)
+        values = []
+        extend = values.extend
+        to_motor_value = self._degrees_to_motor_value
+        for motor_id, degrees, rpm, motor_type in zip(
+            motor_ids, positions_degrees, velocities_rpm, motor_types
+        ):
+            goal_pos = to_motor_value(degrees, motor_type, True)
+            goal_vel = to_motor_value(rpm, motor_type, False)
             
-            print(f"  Motor {motor_ids[i]}: {positions_degrees[i]}° -> {goal_pos}, {velocities_rpm[i]} RPM -> {goal_vel}")
-            
-            # Convert to little-endian bytes
-            pos_bytes = self._get_little_endian_bytes(goal_pos)
-            vel_bytes = self._get_little_endian_bytes(goal_vel)
+            if debug:
+                logger.debug("  Motor %d: %s° -> %d, %s RPM -> %d",
+                             motor_id, degrees, goal_pos, rpm, goal_vel)
             
-            # Combine: [pos_low, pos_high, vel_low, vel_high]
-            motor_data.append(pos_bytes + vel_bytes)
+            extend((motor_id, goal_pos & 0xFFFF, goal_vel & 0xFFFF))
+        
+        # All [ID, pos_low, pos_high, vel_low, vel_high] blocks in one pack call
+        motor_params = motor_block_struct(num_motors).pack(*values)
         
         # Create Dynamixel SYNC WRITE packet
         dynamixel_packet = self._create_dynamixel_sync_write_packet(
-            motor_ids, motor_data, self.GOAL_POSITION_ADDR, 4
+            motor_params, num_motors, self.GOAL_POSITION_ADDR, 4
         )
-        print(f"  Dynamixel packet length: {len(dynamixel_packet)} bytes")
-        print(f"  Dynamixel packet (hex): {dynamixel_packet.hex()}")
+        if debug:
+            logger.debug("  Dynamixel packet length: %d bytes", len(dynamixel_packet))
+            logger.debug("  Dynamixel packet (hex): %s", dynamixel_packet.hex())
         
         # Wrap in LUCI UART packet
         luci_uart_packet = self._create_luci_uart_packet(baud_rate, dynamixel_packet)
-        print(f"  LUCI UART packet length: {len(luci_uart_packet)} bytes")
+        if debug:
+            logger.debug("  LUCI UART packet length: %d bytes", len(luci_uart_packet))
         
         # Create final LUCI packet (module 254, mode 0 = write)
         luci_packet = self._create_luci_packet(254, 0, luci_uart_packet)
-        print(f"  Final LUCI packet length: {len(luci_packet)} bytes")
-        print(f"  Final LUCI packet (hex): {luci_packet.hex()[:100]}...")  # First 100 chars
+        if debug:
+            logger.debug("  Final LUCI packet length: %d bytes", len(luci_packet))
+            logger.debug("  Final LUCI packet (hex): %s...", luci_packet.hex()[:100])  # First 100 chars
         
         # Send packet via serial
         try:
+            self._wait_send_slot(len(luci_packet))
             bytes_sent = self.ser.write(luci_packet)
-            self.ser.flush()
-            print(f"  ✓ Sent {bytes_sent} bytes")
-            time.sleep(0.035)  # Delay matching Android app
+            logger.debug("  ✓ Sent %d bytes", bytes_sent)
             return True
         except Exception as e:
-            print(f"  ✗ Error sending packet: {e}")
+            logger.error("  ✗ Error sending packet: %s", e)
             return False
     
     def send_all_servos(
@@ -358,7 +592,7 @@ class RobotServoControllerUSB:
         positions_degrees: List[float],
         velocities_rpm: Optional[List[float]] = None,
         motor_ids: Optional[List[int]] = None,
-        motor_types: Optional[List[int]] = None,
+        motor_types: Optional[Sequence[int]] = None,
         baud_rate: int = 57142
     ) -> bool:
         """
@@ -374,11 +608,14 @@ class RobotServoControllerUSB:
         Returns:
             True if sent successfully
         """
+        if motor_ids is None and motor_types is None and velocities_rpm is None and baud_rate == 57142:
+            return self.send_default_12(positions_degrees)
+        
         if motor_ids is None:
             motor_ids = list(range(1, 13))  # Motors 1-12
         
         if motor_types is None:
-            motor_types = [self.MOTORTYPE_AX12] * 12  # All AX12
+            motor_types = self.AX12_TYPES_12  # All AX12
         
         if velocities_rpm is None:
             velocities_rpm = [30.0] * 12  # Default 30 RPM
@@ -397,6 +634,51 @@ class RobotServoControllerUSB:
         return self.send_all_servos(neutral_positions, baud_rate=baud_rate)
 
 
+class ServoWriter(threading.Thread):
+    """
+    Background sender for streamed poses (e.g. animation)
+    
+    The caller enqueues poses at its own pace; the writer sends them through a
+    prepare_sync_write_template template as fast as the serial link allows. Only the
+    latest pose is kept, so a slow link drops stale frames instead of lagging behind.
+    """
+    
+    def __init__(
+        self,
+        controller: RobotServoControllerUSB,
+        template: Tuple[bytearray, List[Tuple[int, int]], int, int, Sequence[int]],
+        velocities_rpm: List[float]
+    ):
+        super().__init__(daemon=True)
+        self.controller = controller
+        self.template = template
+        self.velocities_rpm = velocities_rpm
+        self.slot: queue.Queue = queue.Queue(maxsize=1)
+    
+    def enqueue(self, positions_degrees: List[float]):
+        """Replace any pending pose with this one"""
+        try:
+            self.slot.put_nowait(positions_degrees)
+        except queue.Full:
+            try:
+                self.slot.get_nowait()
+            except queue.Empty:
+                pass
+            self.slot.put_nowait(positions_degrees)
+    
+    def stop(self):
+        """Send the last pending pose, then stop and wait for the thread to exit"""
+        self.slot.put(None)
+        self.join()
+    
+    def run(self):
+        while True:
+            positions_degrees = self.slot.get()
+            if positions_degrees is None:
+                break
+            self.controller.send_prepared(self.template, positions_degrees, self.velocities_rpm)
+
+
 # ============================================================================
 # Example Usage
 # ============================================================================
@@ -442,10 +724,15 @@ if __name__ == "__main__":
         
         # Example 4: Animated movement
         print("4. Performing animated movement...")
+        template = controller.prepare_sync_write_template(
+            list(range(1, 13)), controller.AX12_TYPES_12
+        )
+        writer = ServoWriter(controller, template, [30.0] * 12)
+        writer.start()
         for angle in range(90, 210, 10):
-            positions = [angle] * 12
-            controller.send_all_servos(positions)
+            writer.enqueue([angle] * 12)
             time.sleep(0.1)
+        writer.stop()
         
         # Return to neutral
         print("5. Returning to neutral...")
@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 """
 Test script for AX-18A servo with ID 1, baud rate 222222
+
+Packet dumps are shown; pass --quiet to hide them.
 """
 
 from robot_servo_control import RobotServoController
+import logging
+import sys
 import time
 
+logging.basicConfig(level=logging.WARNING if "--quiet" in sys.argv else logging.DEBUG, format="%(message)s")
+
 ROBOT_IP = "192.168.0.132"
 ROBOT_PORT = 7777
 MOTOR_ID = 1